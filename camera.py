@@ -1,11 +1,15 @@
 
 # camera.py
-from picamera2 import Picamera2
+from picamera2 import Picamera2, MappedArray
 from PySide6.QtGui import QImage
 import numpy as np
 import cv2
 from pathlib import Path
 import json
+import os
+import queue
+import threading
+from cpu_layout import WRITER_CPUS  # keeps encoding off the GUI, runner and motor cores
 
 # Try to import tifffile for TIFF saving (optional but recommended)
 try:
@@ -13,6 +17,40 @@ try:
 except ImportError:
     tiff = None  # save_image() will fall back to OpenCV for non-TIFF paths
 
+# orjson parses the settings file several times faster than json (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# tifffile's LZW encoder lives in imagecodecs (optional)
+try:
+    import imagecodecs
+except ImportError:
+    imagecodecs = None
+
+# libjpeg-turbo (SIMD DCT/Huffman) for .jpg saves (optional; OpenCV otherwise)
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _tjpeg = TurboJPEG()
+except Exception:  # module or shared library missing
+    _tjpeg = None
+
+JPEG_QUALITY = 90
+
+# TIFF codec for full-res saves. zlib (DEFLATE) is single-threaded and slow on
+# the Pi; LZW with horizontal differencing compresses 8-bit RGB about as well
+# at several times the throughput. Use None for uncompressed (fastest, largest;
+# frames are then captured straight into a memory-mapped TIFF).
+TIFF_COMPRESSION = "lzw"
+
+if TIFF_COMPRESSION is None:
+    _TIFF_OPTS = {}
+elif TIFF_COMPRESSION == "lzw" and imagecodecs is None:
+    _TIFF_OPTS = {"compression": "zlib", "predictor": True}  # built-in fallback
+else:
+    _TIFF_OPTS = {"compression": TIFF_COMPRESSION, "predictor": True}
+
 # =============================================================================
 # Settings persistence (camera_settings.json)
 # =============================================================================
@@ -30,21 +68,35 @@ DEFAULTS = {
 }
 SETTINGS_PATH = Path("camera_settings.json")
 
+_settings_cache = {"mtime": None, "data": None}  # parsed camera_settings.json
+
+def _loads(raw: bytes) -> dict:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 def load_settings() -> dict:
-    """Load camera settings from JSON; fall back to DEFAULTS on error."""
-    if SETTINGS_PATH.exists():
-        try:
-            return {**DEFAULTS, **json.loads(SETTINGS_PATH.read_text())}
-        except Exception:
-            pass
-    return DEFAULTS.copy()
+    """Load camera settings from JSON; fall back to DEFAULTS on error.
+    The parsed file is cached and only re-read when its mtime changes."""
+    try:
+        mtime = SETTINGS_PATH.stat().st_mtime_ns
+    except OSError:
+        return DEFAULTS.copy()
+    if _settings_cache["data"] is not None and _settings_cache["mtime"] == mtime:
+        return dict(_settings_cache["data"])
+    try:
+        data = {**DEFAULTS, **_loads(SETTINGS_PATH.read_bytes())}
+    except (OSError, TypeError, ValueError):  # unreadable or malformed JSON
+        return DEFAULTS.copy()
+    _settings_cache["mtime"], _settings_cache["data"] = mtime, data
+    return dict(data)
 
 def save_settings(settings: dict) -> bool:
     """Persist camera settings to JSON."""
     try:
         SETTINGS_PATH.write_text(json.dumps(settings, indent=2))
+        _settings_cache["mtime"] = SETTINGS_PATH.stat().st_mtime_ns
+        _settings_cache["data"] = {**DEFAULTS, **settings}
         return True
-    except Exception:
+    except (OSError, TypeError, ValueError):
         return False
 
 # =============================================================================
@@ -52,19 +104,27 @@ def save_settings(settings: dict) -> bool:
 # =============================================================================
 picam = Picamera2()
 
+# Realistic libcamera/Picamera2 failures: RuntimeError (pipeline/control
+# errors), OSError incl. TimeoutError (device/DMA), ValueError/TypeError (bad
+# control values). Anything else is a bug and should surface, not be printed.
+_CAMERA_ERRORS = (RuntimeError, OSError, ValueError, TypeError)
+
 # Full-res still (main) + low-res preview (lores).
 # Adjust 'main' size if your sensor reports a different maximum.
+# NOTE: Picamera2 names formats after the DRM fourcc, so "BGR888" is delivered
+# in memory as R,G,B — exactly what tifffile (photometric="rgb") and
+# QImage.Format_RGB888 expect. No per-frame colour conversion is needed.
+# lores is produced by the ISP at exactly the GUI preview label size, so
+# frames are shown 1:1 with no per-frame rescale on the GUI thread.
+PREVIEW_SIZE = (512, 288)  # (w, h), 16:9
 preview_and_still_cfg = picam.create_still_configuration(
-    main={"size": (4608, 2592), "format": "RGB888"},   # full-resolution for saving
-    lores={"size": (640, 360), "format": "RGB888"}     # 16:9 preview for Live View
+    main={"size": (4608, 2592), "format": "BGR888"},   # full-resolution for saving
+    lores={"size": PREVIEW_SIZE, "format": "BGR888"}   # 16:9 preview for Live View
 )
 picam.configure(preview_and_still_cfg)
 
-def apply_settings(settings: dict = None) -> None:
-    """
-    Apply camera settings to Picamera2. If 'settings' is None, load from JSON.
-    Note: ExposureTime is only set when AE is disabled (AeEnable=False).
-    """
+def _build_controls(settings: dict = None, af_mode: int = 2) -> dict:
+    """Translate saved settings (+ AF mode) into one Picamera2 controls dict."""
     if settings is None:
         settings = load_settings()
 
@@ -82,10 +142,19 @@ def apply_settings(settings: dict = None) -> None:
     # Apply manual exposure only if AE is off
     if not ctrl["AeEnable"]:
         ctrl["ExposureTime"] = int(settings.get("ExposureTime", 20000))
+    if af_mode is not None:
+        ctrl["AfMode"] = int(af_mode)
+    return ctrl
 
+def apply_settings(settings: dict = None, af_mode: int = 2) -> None:
+    """
+    Apply camera settings to Picamera2. If 'settings' is None, load from JSON.
+    Note: ExposureTime is only set when AE is disabled (AeEnable=False).
+    AfMode goes in the same set_controls call (None leaves AF untouched).
+    """
     try:
-        picam.set_controls(ctrl)
-    except Exception as e:
+        picam.set_controls(_build_controls(settings, af_mode))
+    except _CAMERA_ERRORS as e:
         print(f"apply_settings error: {e}", flush=True)
 
 def get_current_settings() -> dict:
@@ -95,20 +164,28 @@ def get_current_settings() -> dict:
 # =============================================================================
 # Start/stop camera
 # =============================================================================
-def start_camera() -> None:
-    """Start Picamera2 pipeline (idempotent). Also enable Continuous AF for Live View."""
+def configure_and_start(settings: dict = None, af_mode: int = 2) -> None:
+    """
+    Apply all controls (settings + AfMode) in a single set_controls, then start
+    the pipeline if it isn't running. Controls set before start() land on the
+    very first frame, so nothing is captured with stale exposure/AF state.
+    """
+    apply_settings(settings, af_mode)
     try:
-        picam.start()
-        set_af_mode(2)  # Continuous AF for preview comfort
-    except Exception:
-        # ignore if already started
-        pass
+        if not picam.started:
+            picam.start()
+    except _CAMERA_ERRORS as e:
+        print(f"configure_and_start error: {e}", flush=True)
+
+def start_camera() -> None:
+    """Start Picamera2 pipeline (idempotent) with saved settings and Continuous AF."""
+    configure_and_start()
 
 def stop_camera() -> None:
     """Stop Picamera2 pipeline."""
     try:
         picam.stop()
-    except Exception:
+    except _CAMERA_ERRORS:
         pass
 
 # =============================================================================
@@ -118,7 +195,7 @@ def set_auto_exposure(enabled: bool) -> None:
     """Enable/disable auto exposure."""
     try:
         picam.set_controls({"AeEnable": bool(enabled)})
-    except Exception as e:
+    except _CAMERA_ERRORS as e:
         print(f"set_auto_exposure error: {e}", flush=True)
 
 def set_af_mode(mode: int = 2) -> None:
@@ -128,7 +205,7 @@ def set_af_mode(mode: int = 2) -> None:
     """
     try:
         picam.set_controls({"AfMode": int(mode)})
-    except Exception as e:
+    except _CAMERA_ERRORS as e:
         print(f"set_af_mode error: {e}", flush=True)
 
 def trigger_autofocus() -> None:
@@ -137,7 +214,7 @@ def trigger_autofocus() -> None:
     """
     try:
         picam.set_controls({"AfTrigger": 1})  # start AF cycle
-    except Exception as e:
+    except _CAMERA_ERRORS as e:
         print(f"trigger_autofocus error: {e}", flush=True)
 
 # =============================================================================
@@ -145,77 +222,283 @@ def trigger_autofocus() -> None:
 # =============================================================================
 def _to_rgb(arr: np.ndarray) -> np.ndarray:
     """
-    Normalize any returned frame to RGB (HxWx3, uint8).
-    Although we requested RGB888, guard against BGRA/BGR inputs.
+    Return the frame as RGB (HxWx3, uint8), guessing from the array shape.
+    Fallback for stream formats not listed in _CONVERT_BY_FORMAT below.
     """
     if arr.ndim == 3:
-        h, w, c = arr.shape
+        c = arr.shape[2]
+        if c == 3:
+            return arr
         if c == 4:
-            return cv2.cvtColor(arr, cv2.COLOR_BGRA2RGB)
-        elif c == 3:
-            # If already RGB this becomes a no-op; if BGR it flips channels.
-            return cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
-        else:
-            return arr[:, :, :3].copy()
+            # BGRA fallback: B,G,R,A → R,G,B as a strided view (channels 2,1,0).
+            # Pure lane shuffle, so no pixel pass here; consumers that need
+            # contiguous memory copy exactly once.
+            return arr[:, :, 2::-1]
+        # Unexpected layout: keep the first three channels (view; the
+        # capture copy packs it)
+        return arr[:, :, :3]
     # Grayscale to RGB
     return cv2.cvtColor(arr, cv2.COLOR_GRAY2RGB)
 
+# Per-format converters to packed-or-strided R,G,B (Picamera2 memory order):
+#   BGR888 = R,G,B   RGB888 = B,G,R   XBGR8888 = R,G,B,X   XRGB8888 = B,G,R,X
+_CONVERT_BY_FORMAT = {
+    "BGR888":   lambda a: a,
+    "RGB888":   lambda a: a[:, :, ::-1],
+    "XBGR8888": lambda a: a[:, :, :3],
+    "XRGB8888": lambda a: a[:, :, 2::-1],
+}
+
+def _converter_for(stream: str):
+    """Pick the frame converter once, from the configured stream format."""
+    fmt = picam.stream_configuration(stream)["format"]
+    if fmt != "BGR888":
+        # Some sensor modes fall back to XRGB8888; still works, just not free
+        print(f"camera: {stream} stream is {fmt}, expected BGR888", flush=True)
+    return _CONVERT_BY_FORMAT.get(fmt, _to_rgb)
+
+_convert_main = _converter_for("main")
+_convert_lores = _converter_for("lores")
+
+# =============================================================================
+# Preallocated capture buffers (reused for every frame; no per-capture malloc)
+# =============================================================================
+def _alloc_for(stream: str) -> np.ndarray:
+    """Allocate an empty contiguous HxWx3 RGB buffer for the configured stream."""
+    w, h = picam.stream_configuration(stream)["size"]
+    return np.empty((h, w, 3), dtype=np.uint8)
+
+_lores_bufs = [_alloc_for("lores"), _alloc_for("lores")]  # double-buffered preview
+_lores_idx = 0
+_lores_lock = threading.Lock()
+
+# Full-res frames (~36 MB each) cycle through a fixed pool: save_image() takes a
+# free buffer, a writer thread hands it back once the file is on disk.
+SAVE_BUFFERS = 3
+_main_free: queue.Queue = queue.Queue()
+for _ in range(SAVE_BUFFERS):
+    _main_free.put(_alloc_for("main"))
+
+# Bound once at import: saves attribute lookups on every preview/save call
+_capture_request = picam.capture_request
+_FMT_RGB888 = QImage.Format_RGB888
+
+def _capture_into(stream: str, out: np.ndarray, convert, metadata: dict = None) -> np.ndarray:
+    """
+    Copy the next frame of 'stream' straight from the camera buffer into 'out'
+    as contiguous RGB. 'convert' (bound at configure time) returns a strided
+    view for any channel fix-up, so the swizzle happens inside this one
+    read-once/write-once copy. If 'metadata' is given it is filled with the
+    normalized metadata of this exact frame.
+    """
+    request = _capture_request()
+    try:
+        with MappedArray(request, stream) as m:
+            np.copyto(out, convert(m.array))
+        if metadata is not None:
+            metadata.update(_pick_metadata(request.get_metadata()))
+    finally:
+        request.release()
+    return out
+
 # =============================================================================
 # Live View (lores stream → QImage for GUI)
 # =============================================================================
 def get_frame() -> QImage:
     """
     Return a QImage (RGB888) for the preview label using the lores stream.
+    The image wraps one of two preallocated module-level buffers (no detach
+    copy); it stays valid until two further get_frame() calls have been made.
     """
-    try:
-        arr = picam.capture_array("lores")  # 640x360; fast preview
-    except Exception as e:
-        print(f"get_frame error: {e}", flush=True)
-        return QImage()
-
-    rgb = _to_rgb(arr)
-    h, w = rgb.shape[:2]
-    rgb_c = np.ascontiguousarray(rgb)
+    global _lores_idx
+    with _lores_lock:
+        _lores_idx ^= 1
+        buf = _lores_bufs[_lores_idx]
+        try:
+            _capture_into("lores", buf, _convert_lores)  # PREVIEW_SIZE; fast preview
+        except _CAMERA_ERRORS as e:
+            print(f"get_frame error: {e}", flush=True)
+            return QImage()
+
+    # Packed by _capture_into(); checked only in debug runs (stripped by -O)
+    assert buf.flags["C_CONTIGUOUS"] and buf.shape[2] == 3
+    h, w = buf.shape[:2]
     bytes_per_line = w * 3
-    qimg = QImage(rgb_c.data, w, h, bytes_per_line, QImage.Format_RGB888)
-    return qimg.copy()  # detach from numpy buffer
+    return QImage(buf.data, w, h, bytes_per_line, _FMT_RGB888)
 
 # =============================================================================
 # Saving full-res frames (main stream)
 # =============================================================================
 _last_saved_shape: tuple[int, int] | None = None  # (height, width) of last saved image
 
-def save_image(path: str) -> bool:
+def save_image(path: str, on_saved=None, create_dirs: bool = False) -> bool:
     """
-    Capture the current full-resolution frame from 'main' and save to 'path'.
-      - If '.tif' or '.tiff' and tifffile is installed → write TIFF (lossless zlib).
+    Capture the current full-resolution frame from 'main' and queue it for saving.
+      - If '.tif' or '.tiff' and tifffile is installed → write TIFF (lossless,
+        codec per TIFF_COMPRESSION).
+      - If '.jpg'/'.jpeg' and PyTurboJPEG is installed → libjpeg-turbo.
       - Otherwise → OpenCV (PNG/JPEG depending on extension).
+    Returns True once the frame is captured and queued; encoding and disk I/O
+    run on a background writer so the caller can move on (e.g. advance the
+    carousel). Blocks only if SAVE_BUFFERS frames are still in flight.
+    'on_saved(path, nbytes, metadata)' is called from the writer thread when
+    the file is written: 'nbytes' is the file size (None if the write
+    failed), 'metadata' the captured frame's own (same keys as
+    get_metadata()), so callers need neither a stat() nor a
+    capture_metadata().
+    The parent directory must already exist unless 'create_dirs' is True.
     Records the last saved shape for downstream CSV logging.
     """
-    try:
-        arr = picam.capture_array("main")  # full-res RGB
-        rgb = _to_rgb(arr)
+    if create_dirs:
         Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if _direct_tiff(path):
+        return _save_tiff_mapped(path, on_saved)
 
-        # Record last saved shape (height, width)
-        global _last_saved_shape
-        h, w = rgb.shape[:2]
-        _last_saved_shape = (h, w)
+    md = {}
+    buf = _main_free.get()
+    try:
+        arr = _capture_into("main", buf, _convert_main, md)  # full-res, contiguous R,G,B
+    except _CAMERA_ERRORS as e:
+        _main_free.put(buf)
+        print(f"save_image error: {e}", flush=True)
+        return False
 
-        ext = Path(path).suffix.lower()
-        if ext in (".tif", ".tiff") and tiff is not None:
-            # Lossless TIFF with RGB photometric
-            tiff.imwrite(path, rgb, photometric="rgb", compression="zlib")
-            return True
+    # Record last saved shape (height, width)
+    global _last_saved_shape
+    h, w = arr.shape[:2]
+    _last_saved_shape = (h, w)
 
-        # Fallback to OpenCV for non-TIFF paths
-        bgr = cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
-        return cv2.imwrite(path, bgr)
+    _ensure_writers()
+    _save_queue.put((arr, path, on_saved, md))
+    return True
 
-    except Exception as e:
+def _direct_tiff(path: str) -> bool:
+    """Uncompressed TIFFs can be captured straight into the file's pages."""
+    return (TIFF_COMPRESSION is None and tiff is not None
+            and Path(path).suffix.lower() in (".tif", ".tiff"))
+
+def _save_tiff_mapped(path: str, on_saved=None) -> bool:
+    """
+    Create the TIFF (header + pixel extent) and memory-map its pixel data, so
+    the capture copy writes into the page cache directly: no pool buffer and
+    no second userland copy through the encoder. The writer only flushes.
+    """
+    global _last_saved_shape
+    w, h = picam.stream_configuration("main")["size"]
+    md = {}
+    try:
+        mm = tiff.memmap(path, shape=(h, w, 3), dtype=np.uint8, photometric="rgb")
+        _capture_into("main", mm, _convert_main, md)
+    except _CAMERA_ERRORS as e:
         print(f"save_image error: {e}", flush=True)
+        # The file already exists at full size; don't leave a black "image"
+        mm = None  # release the mapping before unlinking
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e2:
+            print(f"save_image cleanup error: {e2}", flush=True)
         return False
 
+    _last_saved_shape = (h, w)
+    _ensure_writers()
+    _save_queue.put((mm, path, on_saved, md))
+    return True
+
+def flush_saves() -> None:
+    """Block until every queued image has been written."""
+    _save_queue.join()
+
+def _write_image(arr: np.ndarray, path: str) -> int | None:
+    """Encode and write 'arr'; return the bytes written (None on failure)."""
+    ext = Path(path).suffix.lower()
+    if ext in (".tif", ".tiff") and tiff is not None:
+        # Lossless TIFF with RGB photometric; the buffer is already RGB
+        with open(path, "wb") as f:
+            tiff.imwrite(f, arr, photometric="rgb", **_TIFF_OPTS)
+            return f.tell()
+
+    if ext in (".jpg", ".jpeg") and _tjpeg is not None:
+        # turbojpeg reads the RGB buffer directly (no B,G,R copy)
+        data = _tjpeg.encode(arr, quality=JPEG_QUALITY, pixel_format=TJPF_RGB)
+    else:
+        # OpenCV wants B,G,R: a single channel-reversing copy (no RGB round-trip)
+        bgr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+        ok, data = cv2.imencode(ext or ".png", bgr)
+        if not ok:
+            return None
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data) if isinstance(data, bytes) else data.nbytes
+
+# =============================================================================
+# Thread placement (affinity / priority; used by the writers and the runner)
+# =============================================================================
+def pin_current_thread(cpus=None, nice: int = None) -> None:
+    """
+    Best-effort Linux tuning for the calling thread: restrict it to 'cpus'
+    (ignoring cores that don't exist) and/or set its nice value. Raising
+    priority (nice < 0) needs CAP_SYS_NICE; failures are logged and ignored.
+    """
+    tid = threading.get_native_id()
+    if cpus and hasattr(os, "sched_setaffinity"):
+        try:
+            allowed = set(cpus) & os.sched_getaffinity(0)
+            if allowed:
+                os.sched_setaffinity(tid, allowed)
+        except OSError as e:
+            print(f"pin_current_thread affinity error: {e}", flush=True)
+    if nice is not None and hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, tid, nice)  # per-thread on Linux
+        except OSError as e:
+            print(f"pin_current_thread priority error: {e}", flush=True)
+
+# =============================================================================
+# Background writers (encode + disk I/O off the capture thread)
+# =============================================================================
+# One writer per reserved core: tifffile/OpenCV release the GIL while
+# compressing, but writers sharing a core would only take turns
+SAVE_WRITERS = len(WRITER_CPUS)
+
+_save_queue: queue.Queue = queue.Queue(maxsize=SAVE_BUFFERS)
+_writers: list[threading.Thread] = []
+
+def _ensure_writers() -> None:
+    """Start the writer threads on first use (none exist for Live View-only sessions)."""
+    if _writers:
+        return
+    for i in range(SAVE_WRITERS):
+        t = threading.Thread(target=_writer_loop, name=f"image-writer-{i}", daemon=True)
+        t.start()
+        _writers.append(t)
+
+def _writer_loop() -> None:
+    pin_current_thread(WRITER_CPUS)
+    while True:
+        arr, path, on_saved, md = _save_queue.get()
+        mapped = isinstance(arr, np.memmap)
+        try:
+            if mapped:
+                arr.flush()  # pixels are already in the file's pages
+                nbytes = arr.offset + arr.nbytes  # pixel data ends the file
+            else:
+                nbytes = _write_image(arr, path)
+        except Exception as e:  # encoder errors vary (cv2.error etc.); never kill the writer
+            print(f"save_image error: {e}", flush=True)
+            nbytes = None
+        finally:
+            if not mapped:
+                _main_free.put(arr)
+        del arr  # drop the last reference so a memmap is unmapped
+        if on_saved:
+            try:
+                on_saved(path, nbytes, md)
+            except Exception as e:
+                print(f"save_image callback error: {e}", flush=True)
+        _save_queue.task_done()
+
 # =============================================================================
 # Capture metadata (for CSV logging)
 # =============================================================================
@@ -225,17 +508,20 @@ def get_metadata() -> dict:
     Keys may include (depending on pipeline):
       - 'AeEnable', 'ExposureTime' (µs), 'AnalogueGain', 'AwbEnable'
     """
-    out = {}
     try:
-        md = picam.capture_metadata()  # Picamera2 metadata dict
-        # Normalize common fields (add more here if you need them)
-        out["AeEnable"]      = md.get("AeEnable", None)
-        out["ExposureTime"]  = md.get("ExposureTime", None)   # microseconds
-        out["AnalogueGain"]  = md.get("AnalogueGain", None)
-        out["AwbEnable"]     = md.get("AwbEnable", None)
-    except Exception as e:
+        return _pick_metadata(picam.capture_metadata())  # Picamera2 metadata dict
+    except _CAMERA_ERRORS as e:
         print(f"get_metadata error: {e}", flush=True)
-    return out
+    return {}
+
+def _pick_metadata(md: dict) -> dict:
+    """Normalize common fields (add more here if you need them)."""
+    return {
+        "AeEnable":     md.get("AeEnable", None),
+        "ExposureTime": md.get("ExposureTime", None),   # microseconds
+        "AnalogueGain": md.get("AnalogueGain", None),
+        "AwbEnable":    md.get("AwbEnable", None),
+    }
 
 def get_last_saved_shape() -> tuple[int, int] | None:
     """Return (height, width) of the last saved full-res image, or None."""
@@ -5,38 +5,8 @@ from PySide6.QtWidgets import (
     QFormLayout, QCheckBox, QDoubleSpinBox, QSpinBox
 )
 from PySide6.QtCore import Qt
-import json
-from pathlib import Path
-
-DEFAULTS = {
-    "AeEnable": True,          # Auto Exposure on/off
-    "ExposureTime": 20000,     # µs, used only if AE is disabled
-    "AnalogueGain": 1.0,       # base sensitivity
-    "AwbEnable": True,         # Auto White Balance on/off
-    "Contrast": 1.0,
-    "Brightness": 0.0,         # -1.0..+1.0
-    "Saturation": 1.0,
-    "Sharpness": 1.0,
-    "NoiseReductionMode": 0,   # 0=off (prefer raw-ish data)
-    "HdrEnable": False         # keep HDR off for full-res work
-}
-
-SETTINGS_PATH = Path("camera_settings.json")
-
-def load_settings():
-    if SETTINGS_PATH.exists():
-        try:
-            return {**DEFAULTS, **json.loads(SETTINGS_PATH.read_text())}
-        except Exception:
-            pass
-    return DEFAULTS.copy()
-
-def save_settings(settings: dict):
-    try:
-        SETTINGS_PATH.write_text(json.dumps(settings, indent=2))
-        return True
-    except Exception:
-        return False
+# Settings schema and persistence live in camera.py (single source of truth)
+from camera import DEFAULTS, load_settings, save_settings
 
 class CameraConfigDialog(QDialog):
     def __init__(self, current_settings=None, parent=None):
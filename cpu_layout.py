@@ -0,0 +1,7 @@
+# cpu_layout.py
+# Core assignments for the threads that pin themselves (Raspberry Pi 5, cores
+# 0-3). Each pinned role gets cores no other pinned role uses; the GUI thread
+# is not pinned and has core 0 to itself.
+MOTOR_CPUS = {1}   # step pulses under SCHED_FIFO (motor_control.realtime_thread)
+RUNNER_CPUS = {2}  # ExperimentRunner: settle timing and capture copies
+WRITER_CPUS = {3}  # camera image writers (encode + disk I/O), one per core
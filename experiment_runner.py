@@ -3,11 +3,26 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import time
 import json
-import csv
 import os
+import queue
+import threading
+from functools import partial
 import motor_control
 import camera
-from camera_config import load_settings
+from cpu_layout import RUNNER_CPUS
+
+LOG_FLUSH_S = 0.25   # coalesce status lines into one cross-thread signal per window
+CSV_BATCH_ROWS = 32  # metadata.csv rows buffered before a write (also flushed each cycle)
+CSV_HEADER = (
+    b"timestamp_iso,cycle_index,plate,illumination,image_path,width_px,height_px,"
+    b"file_size_bytes,AeEnable,ExposureTime_us,AnalogueGain,AwbEnable\n"
+)
+# Plate numbers as given by the setup dialog; "Plate N" names are also accepted
+_PLATE_IDS = {**{i: i for i in range(1, 7)}, **{f"Plate {i}": i for i in range(1, 7)}}
+
+
+def _blank(v):
+    return "" if v is None else v
 
 
 class ExperimentRunner(QThread):
@@ -30,112 +45,198 @@ class ExperimentRunner(QThread):
     ):
         super().__init__(parent)
         self.selected_plates = self._normalize_plates(selected_plates)
+        # Fixed visiting order with the capture decision made once per run
+        selected = frozenset(self.selected_plates)
+        self._plate_schedule = tuple((i, i in selected) for i in range(1, 7))
         self.duration_days = int(duration_days)
         self.frequency_minutes = int(frequency_minutes)
         self.illumination_mode = illumination_mode
         self.led_control_fn = led_control_fn
         self.perform_homing = perform_homing  # allow GUI to do homing-with-preview then skip here
-        self._abort = False
+        self._abort_event = threading.Event()
+        self._log_buf = []            # status lines not yet emitted
+        self._log_flush_mono = 0.0
+        self._log_lock = threading.Lock()  # _log is also called from writer threads
         self.wait_seconds_for_camera = 10
+        self.cpus = set(RUNNER_CPUS)  # capture path core (see cpu_layout)
+        self.nice = -5       # needs CAP_SYS_NICE; ignored otherwise
         self.cycle_count = 0
 
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        started = datetime.now()  # one clock read for the folder name and metadata
+        ts = started.strftime("%Y%m%d_%H%M%S")
         root = Path("/home/sybednar/Seedling_Imager/images").expanduser()
         self.run_dir = root / f"experiment_{ts}"
         self.run_dir.mkdir(parents=True, exist_ok=True)
-        for p in range(1, 7):
-            (self.run_dir / f"plate{p}").mkdir(exist_ok=True)
+        # Plate folder paths as strings, reused for every capture filename
+        self._plate_dirs: list[str] = [str(self.run_dir / f"plate{p}") for p in range(1, 7)]
+        for p in self.selected_plates:  # only plates that will receive images
+            try:
+                os.mkdir(self._plate_dirs[p - 1])
+            except FileExistsError:
+                pass
 
-        self.cam_settings = load_settings()
+        self.cam_settings = camera.load_settings()  # mtime-cached; no re-parse per run
         meta_path = self.run_dir / "metadata.json"
         meta = {
-            "timestamp_start": datetime.now().isoformat(timespec="seconds"),
+            "timestamp_start": started.isoformat(timespec="seconds"),
             "illumination_mode": self.illumination_mode,
             "selected_plates": self.selected_plates,
             "frequency_minutes": self.frequency_minutes,
             "duration_days": self.duration_days,
             "camera_settings": self.cam_settings,
         }
-        meta_path.write_text(json.dumps(meta, indent=2))
+        with open(meta_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+            json.dump(meta, f, indent=2)
 
         self.csv_path = self.run_dir / "metadata.csv"
         self.csv_file = None
-        self.csv_writer = None
+        self._csv_lock = threading.Lock()  # rows are written from camera writer threads
+        self._csv_batch = []               # encoded rows not yet written to csv_file
+        # fsync metadata.csv at cycle boundaries only (never per row): a crash
+        # loses at most one cycle (frequency_minutes) of rows
+        self.fsync_each_cycle = True
 
-    def _normalize_plates(self, plate_names):
-        idxs = []
-        for name in plate_names:
-            try:
-                idxs.append(int(name.split()[-1]))
-            except Exception:
-                pass
-        return [p for p in idxs if 1 <= p <= 6]
+    def _normalize_plates(self, plates):
+        return [_PLATE_IDS[p] for p in plates if p in _PLATE_IDS]
+
+    @property
+    def _abort(self):
+        return self._abort_event.is_set()
 
     def abort(self):
-        self._abort = True
+        self._abort_event.set()
 
     def _log(self, msg):
-        self.status_signal.emit(msg)
+        """Queue a status line; emit the batch at most every LOG_FLUSH_S."""
+        with self._log_lock:
+            self._log_buf.append(msg)
+            if time.monotonic() - self._log_flush_mono < LOG_FLUSH_S:
+                return
+        self._flush_log()
+
+    def _log_now(self, msg):
+        """Emit immediately (with anything still queued), e.g. terminal messages."""
+        with self._log_lock:
+            self._log_buf.append(msg)
+        self._flush_log()
+
+    def _flush_log(self):
+        with self._log_lock:
+            if not self._log_buf:
+                return
+            batch = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            self._log_flush_mono = time.monotonic()
+        self.status_signal.emit(batch)
 
     def _sleep_with_abort(self, seconds):
-        end = time.time() + seconds
-        while time.time() < end and not self._abort:
-            time.sleep(0.1)
+        """Block until the timeout or abort(); True if abort was requested."""
+        self._flush_log()  # nothing else will be logged while we wait
+        return self._abort_event.wait(timeout=seconds)
 
     def _open_csv(self):
         try:
-            self.csv_file = open(self.csv_path, "w", newline="", encoding="utf-8")
-            self.csv_writer = csv.writer(self.csv_file)
-            self.csv_writer.writerow(
-                [
-                    "timestamp_iso",
-                    "cycle_index",
-                    "plate",
-                    "illumination",
-                    "image_path",
-                    "width_px",
-                    "height_px",
-                    "file_size_bytes",
-                    "AeEnable",
-                    "ExposureTime_us",
-                    "AnalogueGain",
-                    "AwbEnable",
-                ]
-            )
+            self.csv_file = open(self.csv_path, "wb", buffering=1 << 20)
+            self.csv_file.write(CSV_HEADER)
         except Exception as e:
             self._log(f"CSV open error: {e}")
 
+    def _flush_csv(self, force=False, sync=False):
+        """Write batched rows once CSV_BATCH_ROWS accumulate (or always if force).
+        'sync' additionally fsyncs the file so the rows survive power loss."""
+        with self._csv_lock:
+            if not self.csv_file:
+                return
+            if self._csv_batch and (force or len(self._csv_batch) >= CSV_BATCH_ROWS):
+                self.csv_file.write(b"".join(self._csv_batch))
+                self._csv_batch.clear()
+            if force:
+                self.csv_file.flush()
+            if sync:
+                try:
+                    os.fsync(self.csv_file.fileno())
+                except OSError as e:
+                    self._log(f"CSV fsync error: {e}")
+
     def _close_csv(self):
         try:
+            self._flush_csv(force=True, sync=self.fsync_each_cycle)
             if self.csv_file:
                 self.csv_file.flush()
                 self.csv_file.close()
         except Exception:
             pass
 
+    def _record_capture(self, ts_iso, cycle_index, plate_idx, img_path, file_size, md):
+        """Called from a camera writer thread once the image is on disk.
+        'file_size' comes from the writer (None = failed); 'md' is the saved
+        frame's own metadata (AE was locked for it)."""
+        if file_size is None:
+            self._log(f"Write failed on plate {plate_idx}: {img_path}")
+            return
+
+        width = height = None
+        shape = camera.get_last_saved_shape()
+        if shape:
+            height, width = shape
+
+        md_get = md.get
+        AeEnable = md_get("AeEnable")
+        ExposureTime = md_get("ExposureTime")
+        AnalogueGain = md_get("AnalogueGain")
+        AwbEnable = md_get("AwbEnable")
+
+        # Fields are numbers, bools and comma-free ASCII (fixed run_dir, enum
+        # illumination), so no CSV quoting is needed; None → empty like csv.writer
+        row = (
+            f"{ts_iso},{cycle_index},{plate_idx},{self.illumination_mode},{img_path},"
+            f"{_blank(width)},{_blank(height)},{_blank(file_size)},{_blank(AeEnable)},"
+            f"{_blank(ExposureTime)},{_blank(AnalogueGain)},{_blank(AwbEnable)}\n"
+        ).encode()
+        with self._csv_lock:
+            self._csv_batch.append(row)
+        self._flush_csv()
+        self.image_saved_signal.emit(img_path)
+        self._log(f"Saved: {img_path}")
+
     def run(self):
+        # Steadier settle/capture timing: dedicated cores + higher priority
+        camera.pin_current_thread(self.cpus, nice=self.nice)
+
         if not self.selected_plates:
-            self._log("No plates selected; experiment aborted.")
+            self._log_now("No plates selected; experiment aborted.")
             self.finished_signal.emit()
             return
 
         # Ensure driver is enabled prior to any motion (GUI STOP may have left EN high)
         motor_control.driver_enable()  # EN low = enabled per your wiring
 
+        # Start camera & apply settings for the acquisition phase. The pipeline
+        # start (1-2 s) is independent of the motor, so it overlaps homing.
+        cam_q = queue.Queue(maxsize=1)
+
+        def _cam_startup():
+            try:
+                camera.configure_and_start(self.cam_settings)
+                cam_q.put(None)
+            except Exception as e:
+                cam_q.put(e)
+
+        threading.Thread(target=_cam_startup, name="camera-startup", daemon=True).start()
+
         # Optionally perform homing here (if GUI didn't already do homing-with-preview)
         if self.perform_homing:
-            plate = motor_control.home(status_callback=self.status_signal.emit)
+            plate = motor_control.home(status_callback=self._log, should_abort=self._abort_event)
             if plate is None:
-                self._log("Homing failed; experiment aborted.")
+                cam_q.get()
+                camera.stop_camera()
+                self._log_now("Homing failed; experiment aborted.")
                 self.finished_signal.emit()
                 return
 
-        # Start camera & apply settings for the acquisition phase
-        try:
-            camera.start_camera()
-            camera.apply_settings(self.cam_settings)
-        except Exception as e:
-            self._log(f"Camera start error: {e}")
+        cam_error = cam_q.get()
+        if cam_error is not None:
+            self._log_now(f"Camera start error: {cam_error}")
             self.finished_signal.emit()
             return
 
@@ -145,14 +246,18 @@ class ExperimentRunner(QThread):
             f"every {self.frequency_minutes} min. Illumination: {self.illumination_mode}"
         )
 
-        end_time = datetime.now() + timedelta(days=self.duration_days)
+        now = datetime.now  # bound once for the capture loop
+        # Monotonic deadline: cheap to read and immune to wall-clock (NTP) jumps
+        end_time = time.monotonic() + timedelta(days=self.duration_days).total_seconds()
+        ae_on = None  # unknown until the first settle sets it
         try:
-            while datetime.now() < end_time and not self._abort:
+            while time.monotonic() < end_time and not self._abort:
                 self.cycle_count += 1
-                motor_control.goto_plate(1, status_callback=self.status_signal.emit)
+                cycle_ts = now().strftime("%Y%m%d_%H%M%S")  # shared by this cycle's filenames
+                motor_control.goto_plate(1, status_callback=self._log, should_abort=self._abort_event)
                 self.plate_signal.emit(1)
 
-                for plate_idx in range(1, 7):
+                for plate_idx, capture_this in self._plate_schedule:
                     if self._abort:
                         break
 
@@ -160,8 +265,10 @@ class ExperimentRunner(QThread):
                     if self.led_control_fn:
                         self.led_control_fn(True, self.illumination_mode)
 
-                    # Settle with AE on
-                    camera.set_auto_exposure(True)
+                    # Settle with AE on (only touch the control when it changes)
+                    if ae_on is not True:
+                        camera.set_auto_exposure(True)
+                        ae_on = True
                     self.settling_started.emit(plate_idx)
                     self._log(f"Plate #{plate_idx}: waiting {self.wait_seconds_for_camera}s...")
                     self._sleep_with_abort(self.wait_seconds_for_camera)
@@ -172,48 +279,16 @@ class ExperimentRunner(QThread):
 
                     # Lock AE, then capture if selected
                     camera.set_auto_exposure(False)
+                    ae_on = False
 
-                    if plate_idx in self.selected_plates:
-                        ts_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        img_name = f"plate{plate_idx}_{ts_str}.tif"
-                        img_path = str(self.run_dir / f"plate{plate_idx}" / img_name)
-                        saved = camera.save_image(img_path)
-                        if saved:
-                            width = height = None
-                            shape = camera.get_last_saved_shape()
-                            if shape:
-                                height, width = shape
-                            try:
-                                file_size = Path(img_path).stat().st_size
-                            except Exception:
-                                file_size = None
-
-                            md = camera.get_metadata()
-                            AeEnable = md.get("AeEnable", None)
-                            ExposureTime = md.get("ExposureTime", None)
-                            AnalogueGain = md.get("AnalogueGain", None)
-                            AwbEnable = md.get("AwbEnable", None)
-
-                            if self.csv_writer:
-                                self.csv_writer.writerow(
-                                    [
-                                        datetime.now().isoformat(timespec="seconds"),
-                                        self.cycle_count,
-                                        plate_idx,
-                                        self.illumination_mode,
-                                        img_path,
-                                        width,
-                                        height,
-                                        file_size,
-                                        AeEnable,
-                                        ExposureTime,
-                                        AnalogueGain,
-                                        AwbEnable,
-                                    ]
-                                )
-                            self.image_saved_signal.emit(img_path)
-                            self._log(f"Saved: {img_path}")
-                        else:
+                    if capture_this:
+                        img_path = f"{self._plate_dirs[plate_idx - 1]}/plate{plate_idx}_{cycle_ts}.tif"
+                        # Encode, stat and CSV row happen on a camera writer thread;
+                        # the carousel advances while the file is written.
+                        ts_iso = now().isoformat(timespec="seconds")
+                        on_saved = partial(self._record_capture, ts_iso, self.cycle_count, plate_idx)
+                        saved = camera.save_image(img_path, on_saved=on_saved, create_dirs=False)  # made in __init__
+                        if not saved:
                             self._log(f"Capture failed on plate {plate_idx}")
                     else:
                         self._log(f"Plate #{plate_idx}: skipped.")
@@ -221,21 +296,25 @@ class ExperimentRunner(QThread):
                     # LED OFF, prep for next plate
                     if self.led_control_fn:
                         self.led_control_fn(False, self.illumination_mode)
-                    camera.set_auto_exposure(True)
 
-                    motor_control.advance(status_callback=self.status_signal.emit)
+                    motor_control.advance(status_callback=self._log)
                     self.plate_signal.emit(1 if plate_idx == 6 else plate_idx + 1)
 
                 if plate_idx == 6 and not self._abort:
                     self._log(f"Cycle complete. Waiting {self.frequency_minutes} min...")
+                    # Persist this cycle's rows before the long idle wait
+                    camera.flush_saves()
+                    self._flush_csv(force=True, sync=self.fsync_each_cycle)
                     self._sleep_with_abort(self.frequency_minutes * 60)
         finally:
-            self._log("Experiment finished." if not self._abort else "Experiment aborted.")
+            self._log_now("Experiment finished." if not self._abort else "Experiment aborted.")
             try:
                 camera.stop_camera()
             except Exception:
                 pass
             if self.led_control_fn:
                 self.led_control_fn(False, self.illumination_mode)
+            camera.flush_saves()  # let queued images land before closing the CSV
             self._close_csv()
+            self._flush_log()  # "Saved: ..." lines from the last writes
             self.finished_signal.emit()
\ No newline at end of file
@@ -4,20 +4,38 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMessageBox,
     QGridLayout, QCheckBox, QLineEdit
 )
-from PySide6.QtCore import Qt
-from styles import dark_style
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
+from styles import dark_style, set_style_property
 import shutil
+import time
 from pathlib import Path
 
 ILLUM_GREEN = "Green"
 ILLUM_IR = "Infrared"
 
-SEA_FOAM_GREEN = "#26A69A"
-DEEP_RED = "#B71C1C"
-
 # ---- NEW: constants for storage estimate ----
 IMAGES_ROOT = Path("/home/sybednar/Seedling_Imager/images").expanduser()
 AVG_IMAGE_MB = 15.0  # Adjust if your TIFF files average larger/smaller
+ESTIMATE_DEBOUNCE_MS = 50   # coalesce keystrokes/toggles into one recompute
+DISK_USAGE_TTL_S = 2.0      # reuse the statvfs result for this long
+
+class _DiskProbeSignals(QObject):
+    done = Signal(object)  # free GB (float) or None
+
+
+class _DiskProbe(QRunnable):
+    """statvfs on IMAGES_ROOT off the GUI thread (SD cards/NFS can stall)."""
+    def __init__(self):
+        super().__init__()
+        self.signals = _DiskProbeSignals()
+
+    def run(self):
+        try:
+            free_gb = shutil.disk_usage(IMAGES_ROOT).free / (1024 ** 3)
+        except Exception:
+            free_gb = None
+        self.signals.done.emit(free_gb)
+
 
 class ExperimentSetupDialog(QDialog):
     def __init__(self, parent=None):
@@ -27,14 +45,18 @@ class ExperimentSetupDialog(QDialog):
         self.setStyleSheet(dark_style)
 
         self.selected_illum = ILLUM_GREEN
+        self._estimate_pending = False
+        self._disk_free_cache = (float("-inf"), None)  # (monotonic time, free GB)
+        self._disk_probe = None  # in-flight _DiskProbe, if any
+        self._last_est_key = None  # inputs behind the label currently shown
 
         main_layout = QVBoxLayout()
 
         # Illumination row (unchanged)
         illum_row = QHBoxLayout()
         illum_label = QLabel("Illumination:")
-        illum_label.setStyleSheet("font-size: 18px; color: white;")
         self.illum_toggle = QPushButton(self.selected_illum)
+        self.illum_toggle.setObjectName("illumToggle")
         self.illum_toggle.setFixedSize(160, 48)
         self.apply_illum_style()
         self.illum_toggle.clicked.connect(self.toggle_illum)
@@ -46,15 +68,14 @@ class ExperimentSetupDialog(QDialog):
         # Duration (unchanged except signal to recompute estimate)
         duration_layout = QHBoxLayout()
         duration_label = QLabel("Duration (days):")
-        duration_label.setStyleSheet("font-size: 18px; color: white;")
         self.duration_value = QLineEdit("1")
         self.duration_value.setAlignment(Qt.AlignCenter)
         self.duration_value.setFixedSize(110, 60)
-        self.duration_value.setStyleSheet("background-color: white; color: black; font-size: 22px;")
+        self.duration_value.setObjectName("numBox")
         duration_up = QPushButton("▲"); duration_down = QPushButton("▼")
         for btn in (duration_up, duration_down):
             btn.setFixedSize(58, 60)
-            btn.setStyleSheet("background-color: #ccc; font-size: 24px; font-weight: bold;")
+            btn.setObjectName("arrow")
         duration_up.clicked.connect(lambda: self.adjust_value(self.duration_value, 1, 1, 7))
         duration_down.clicked.connect(lambda: self.adjust_value(self.duration_value, -1, 1, 7))
         # Recompute when value is edited manually
@@ -69,15 +90,14 @@ class ExperimentSetupDialog(QDialog):
         # Frequency
         freq_layout = QHBoxLayout()
         freq_label = QLabel("Acquisition Frequency (minutes):")
-        freq_label.setStyleSheet("font-size: 18px; color: white;")
         self.freq_value = QLineEdit("1") #changed value to 1 for testing, change back to 30 min for final version
         self.freq_value.setAlignment(Qt.AlignCenter)
         self.freq_value.setFixedSize(110, 60)
-        self.freq_value.setStyleSheet("background-color: white; color: black; font-size: 22px;")
+        self.freq_value.setObjectName("numBox")
         freq_up = QPushButton("▲"); freq_down = QPushButton("▼")
         for btn in (freq_up, freq_down):
             btn.setFixedSize(58, 60)
-            btn.setStyleSheet("background-color: #ccc; font-size: 24px; font-weight: bold;")
+            btn.setObjectName("arrow")
         freq_up.clicked.connect(lambda: self.adjust_value(self.freq_value, 30, 1, 360))
         freq_down.clicked.connect(lambda: self.adjust_value(self.freq_value, -30, 1, 360))
         # Recompute when value is edited manually
@@ -92,7 +112,6 @@ class ExperimentSetupDialog(QDialog):
         # Instruction
         instruction_label = QLabel("Select plates for experiment:")
         instruction_label.setAlignment(Qt.AlignCenter)
-        instruction_label.setStyleSheet("font-size: 18px; color: white;")
         main_layout.addWidget(instruction_label)
 
         # Two-row plate grid (unchanged except connect signals)
@@ -103,12 +122,7 @@ class ExperimentSetupDialog(QDialog):
             h = QHBoxLayout(); h.setSpacing(24); h.setAlignment(Qt.AlignCenter)
             for name in names:
                 cb = QCheckBox(name)
-                cb.setStyleSheet(
-                    "QCheckBox { color: white; font-size: 16px; } "
-                    "QCheckBox::indicator { width: 22px; height: 22px; } "
-                    "QCheckBox::indicator:unchecked { border: 2px solid #BBBBBB; background: #222222; } "
-                    "QCheckBox::indicator:checked { border: 2px solid #1E88E5; background: #1E88E5; } "
-                )
+                cb.setObjectName("plateBox")
                 cb.toggled.connect(self.update_storage_estimate)  # <-- recompute when plate selection changes
                 self.plate_checkboxes[name] = cb
                 h.addWidget(cb)
@@ -117,15 +131,15 @@ class ExperimentSetupDialog(QDialog):
         # ---- NEW: storage estimate label ----
         self.storage_label = QLabel("")
         self.storage_label.setAlignment(Qt.AlignCenter)
-        self.storage_label.setStyleSheet("font-size: 16px; color: #CCCCCC;")
+        self.storage_label.setObjectName("storageLabel")
         main_layout.addWidget(self.storage_label)
 
         # Buttons
         button_layout = QHBoxLayout()
         self.start_button = QPushButton("Start Experiment")
         self.exit_button = QPushButton("Exit")
-        self.start_button.setStyleSheet("background-color: #43A047; color: white; font-weight: bold; padding: 10px; font-size: 18px;")
-        self.exit_button.setStyleSheet("background-color: #E53935; color: white; font-weight: bold; padding: 10px; font-size: 18px;")
+        self.start_button.setObjectName("startButton")
+        self.exit_button.setObjectName("exitButton")
         self.start_button.clicked.connect(self.validate_and_start)
         self.exit_button.clicked.connect(self.reject)
         button_layout.addStretch()
@@ -137,18 +151,12 @@ class ExperimentSetupDialog(QDialog):
         self.setLayout(main_layout)
 
         # Initial compute
-        self.update_storage_estimate()
+        self._do_estimate()
 
     # --- existing helpers (illumination & adjust_value) unchanged ---
     def apply_illum_style(self):
-        if self.selected_illum == ILLUM_GREEN:
-            self.illum_toggle.setStyleSheet(
-                f"background-color: {SEA_FOAM_GREEN}; color: white; font-size: 18px; font-weight: bold; border-radius: 8px;"
-            )
-        else:
-            self.illum_toggle.setStyleSheet(
-                f"background-color: {DEEP_RED}; color: white; font-size: 18px; font-weight: bold; border-radius: 8px;"
-            )
+        # Colors live in dark_style (QPushButton#illumToggle[illum=...])
+        set_style_property(self.illum_toggle, "illum", self.selected_illum)
 
     def toggle_illum(self):
         self.selected_illum = ILLUM_IR if self.selected_illum == ILLUM_GREEN else ILLUM_GREEN
@@ -167,6 +175,28 @@ class ExperimentSetupDialog(QDialog):
 
     # ---- NEW: storage estimate computation ----
     def update_storage_estimate(self):
+        """Schedule one recompute; further changes within the window coalesce."""
+        if not self._estimate_pending:
+            self._estimate_pending = True
+            QTimer.singleShot(ESTIMATE_DEBOUNCE_MS, self._do_estimate)
+
+    def _free_gb(self):
+        """Cached free space; a stale cache starts a background probe and the
+        estimate is redrawn when it reports back."""
+        stamp, free_gb = self._disk_free_cache
+        if time.monotonic() - stamp >= DISK_USAGE_TTL_S and self._disk_probe is None:
+            self._disk_probe = _DiskProbe()
+            self._disk_probe.signals.done.connect(self._on_disk_probe)
+            QThreadPool.globalInstance().start(self._disk_probe)
+        return free_gb
+
+    def _on_disk_probe(self, free_gb):
+        self._disk_probe = None
+        self._disk_free_cache = (time.monotonic(), free_gb)
+        self._do_estimate()
+
+    def _do_estimate(self):
+        self._estimate_pending = False
         try:
             duration_days = int(self.duration_value.text())
             frequency_minutes = int(self.freq_value.text())
@@ -182,28 +212,31 @@ class ExperimentSetupDialog(QDialog):
         est_gb = (images * AVG_IMAGE_MB) / 1024.0
 
         # disk free
-        try:
-            total, used, free = shutil.disk_usage(IMAGES_ROOT)
-            free_gb = free / (1024 ** 3)
-        except Exception:
-            free_gb = None
+        free_gb = self._free_gb()
+
+        # Nothing visible changed (e.g. focus in/out of a field): skip the
+        # label update and its re-polish
+        key = (n_plates, duration_days, frequency_minutes,
+               None if free_gb is None else round(free_gb, 1))
+        if key == self._last_est_key:
+            return
+        self._last_est_key = key
 
+        state = ""  # neutral gray; "ok"/"over" colors come from dark_style
         if n_plates == 0:
             msg = "No plates selected — storage estimate unavailable."
-            style = "font-size: 16px; color: #CCCCCC;"
         else:
             msg = f"Estimated storage: ~{est_gb:.1f} GB  ({images} images over {cycles} cycles)"
             if free_gb is not None:
                 msg += f"  |  Free: {free_gb:.1f} GB"
-                style = "font-size: 16px; color: #43A047;" if est_gb <= free_gb else "font-size: 16px; color: #E53935;"
-            else:
-                style = "font-size: 16px; color: #CCCCCC;"
+                state = "ok" if est_gb <= free_gb else "over"
 
         self.storage_label.setText(msg)
-        self.storage_label.setStyleSheet(style)
+        set_style_property(self.storage_label, "state", state)
 
     def validate_and_start(self):
-        selected = [name for name, cb in self.plate_checkboxes.items() if cb.isChecked()]
+        # Plate numbers (1-6), in checkbox order "Plate 1".."Plate 6"
+        selected = tuple(i for i, cb in enumerate(self.plate_checkboxes.values(), 1) if cb.isChecked())
         if not selected:
             QMessageBox.warning(self, "Validation Error", "Please select at least one plate before starting the experiment.")
             return
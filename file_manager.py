@@ -3,18 +3,26 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QListWidget,
     QListWidgetItem, QTextEdit, QFileDialog, QMessageBox, QTabWidget,
-    QWidget, QScrollArea, QGridLayout, QFrame, QToolBar, QComboBox,
-    QTableWidget, QTableWidgetItem, QAbstractItemView
+    QWidget, QListView, QToolBar, QComboBox,
+    QTableView, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QAction, QKeySequence, QPixmap, QImage
+from PySide6.QtCore import (
+    Qt, QSize, QObject, QRunnable, QThreadPool, Signal,
+    QAbstractListModel, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QAction, QKeySequence, QPixmap, QImage, QImageReader
 
 from pathlib import Path
 import json
 import shutil
+import subprocess
 import zipfile
 import os
 import csv
+import hashlib
+import sys
+from collections import OrderedDict
+from operator import itemgetter
 import numpy as np
 
 # Optional imports (handled gracefully)
@@ -33,109 +41,245 @@ try:
 except Exception:
     cv2 = None
 
+try:
+    import fcntl  # reflink ioctl for exports (Linux)
+except Exception:
+    fcntl = None
+
+try:
+    import pandas as pd  # C CSV parser for large metadata.csv files
+except Exception:
+    pd = None
+
 IMAGES_ROOT = Path("/home/sybednar/Seedling_Imager/images").expanduser()
 IMG_EXTS = {".tif", ".tiff", ".png", ".jpg", ".jpeg"}
+_IMG_SUFFIXES = tuple(IMG_EXTS)  # str.endswith() form for the directory scan
+THUMB_CACHE_DIR = IMAGES_ROOT / ".thumbcache"  # pre-scaled JPEG thumbnails
+THUMB_MEM_CACHE = 512  # scaled QPixmaps kept in memory across filter/selection changes
+THUMB_SIZE = QSize(160, 160)
+# Already-compressed image formats are stored as-is in ZIP archives;
+# deflating them again costs CPU for almost no size reduction
+ZIP_STORED_SUFFIXES = (".tif", ".tiff", ".png", ".jpg", ".jpeg")
+CSV_RESIZE_ROWS = 200  # rows sampled when fitting CSV column widths
 
 # ---------- small utilities ----------
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 def human_size(bytes_val: int) -> str:
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(bytes_val)
-    for unit in units:
-        if size < 1024.0 or unit == units[-1]:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
+    b = int(bytes_val)
+    i = min(4, max(0, (b.bit_length() - 1) // 10))  # 1024**i <= b < 1024**(i+1)
+    return f"{b / (1 << (i * 10)):.2f} {_SIZE_UNITS[i]}"
+
+def _scan(path: str):
+    """Recursive os.scandir walk yielding (is_img, path_str, size, mtime_ns) per
+    file. DirEntry.stat() is cached on the entry, so each file is stat'ed once."""
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for e in it:
+            name = e.name
+            if name[0] == ".":
+                continue  # hidden files/dirs (.thumbcache, editor temp files)
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    yield from _scan(e.path)
+                    continue
+                st = e.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            yield (name.lower().endswith(_IMG_SUFFIXES),
+                   e.path, st.st_size, st.st_mtime_ns)
 
 def folder_size(path: Path) -> int:
-    total = 0
-    for root, _, files in os.walk(path):
-        for f in files:
-            try:
-                total += (Path(root) / f).stat().st_size
-            except Exception:
-                pass
-    return total
+    return sum(size for _, _, size, _ in _scan(str(path)))
 
 def list_images(path: Path) -> list[Path]:
+    return scan_experiment(path)[0]
+
+def scan_experiment(path: Path) -> tuple[list[Path], int]:
+    """One pass for both list_images() (newest first) and folder_size()."""
+    total = 0
     imgs = []
-    for root, _, files in os.walk(path):
-        for f in files:
-            if Path(f).suffix.lower() in IMG_EXTS:
-                imgs.append(Path(root) / f)
-    return sorted(imgs, key=lambda p: p.stat().st_mtime, reverse=True)  # newest first
+    for entry in _scan(str(path)):
+        total += entry[2]
+        if entry[0]:
+            imgs.append(entry)
+    imgs.sort(key=itemgetter(3), reverse=True)
+    return [Path(e[1]) for e in imgs], total
+
+def dir_stamp(path: Path) -> tuple:
+    """mtimes of 'path' and its immediate subfolders (the plateN dirs).
+    A file added/removed/renamed in any of them changes the stamp."""
+    try:
+        top = path.stat().st_mtime_ns
+        with os.scandir(path) as it:
+            subs = sorted((e.name, e.stat(follow_symlinks=False).st_mtime_ns)
+                          for e in it if e.is_dir(follow_symlinks=False))
+    except OSError:
+        return ()
+    return (top, tuple(subs))
+
+def open_external(path) -> None:
+    """Open a file/folder with the desktop default app (no shell, not waited on)."""
+    subprocess.Popen(["xdg-open", str(path)], stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
 
 # ---------- robust thumbnail loader ----------
 
 def _to_rgb8(arr: np.ndarray) -> np.ndarray:
     """
-    Convert an ndarray to 8-bit RGB:
-      - grayscale -> stack to RGB
-      - RGBA -> drop alpha
-      - 16-bit -> downscale to 8-bit by shifting/right dividing
+    Convert an ndarray to C-contiguous 8-bit RGB (safe to wrap in a QImage):
+      - multi-page (frames, H, W) -> first frame
+      - RGBA -> drop alpha; 1-2 channels -> grayscale
+      - 16-bit -> 8-bit by shifting straight into the output buffer
+      - grayscale -> RGB in one pass
     """
-    if arr.ndim == 2:
-        # grayscale → RGB
-        g = arr
-        # to 8-bit
-        if g.dtype == np.uint16:
-            g8 = (g >> 8).astype(np.uint8)
-        else:
-            g8 = g.astype(np.uint8)
-        rgb = np.stack([g8, g8, g8], axis=-1)
-        return rgb
-
+    if arr.ndim == 3 and arr.shape[0] > 4 and arr.shape[-1] not in (3, 4):
+        arr = arr[0]
+    if arr.ndim not in (2, 3):
+        arr = np.squeeze(arr)
+        if arr.ndim not in (2, 3):
+            return None  # give up
     if arr.ndim == 3:
-        # If it's multi-page, pick first page/frame
-        if arr.shape[0] > 4 and arr.shape[-1] not in (3, 4):  # e.g., (frames, H, W)
-            arr = arr[0]
+        arr = arr[:, :, :3] if arr.shape[2] >= 3 else arr[:, :, 0]
+
+    # One write into a fresh contiguous uint8 buffer (no uint16 temporary)
+    u8 = np.empty(arr.shape, dtype=np.uint8)
+    if arr.dtype == np.uint16:
+        np.right_shift(arr, 8, out=u8, casting="unsafe")
+    else:
+        np.copyto(u8, arr, casting="unsafe")
 
-        h, w, c = arr.shape
-        if c == 4:
-            arr = arr[:, :, :3]  # drop alpha
+    if u8.ndim == 2:
+        if cv2 is not None:
+            return cv2.cvtColor(u8, cv2.COLOR_GRAY2RGB)
+        return np.repeat(u8[:, :, None], 3, axis=2)
+    return u8
 
-        # 16-bit → 8-bit
-        if arr.dtype == np.uint16:
-            arr8 = (arr >> 8).astype(np.uint8)
-        else:
-            arr8 = arr.astype(np.uint8)
+def _thumb_cache_path(p: Path, thumb_size: QSize, st: os.stat_result = None) -> Path:
+    """Cache file keyed by path + mtime + size, so edited/replaced images miss."""
+    st = st or p.stat()
+    key = hashlib.sha1(f"{p}|{st.st_mtime_ns}|{st.st_size}".encode()).hexdigest()
+    return THUMB_CACHE_DIR / f"{key}-{thumb_size.width()}x{thumb_size.height()}.jpg"
 
-        return arr8
+def clear_thumbcache():
+    shutil.rmtree(THUMB_CACHE_DIR, ignore_errors=True)
 
-    # Fallback: try flatten to 3-ch
-    arr = np.squeeze(arr)
-    if arr.ndim == 2:
-        return _to_rgb8(arr)
-    elif arr.ndim == 3:
-        return _to_rgb8(arr)
-    else:
-        # give up
+def thumbnail_image(p: Path, thumb_size: QSize, st: os.stat_result = None) -> QImage | None:
+    """
+    Return a thumbnail QImage, from the on-disk thumbnail cache when possible;
+    otherwise decode it (see _decode_image) and store it in the cache.
+    'st' may carry an existing stat() of 'p' to avoid another syscall.
+    Uses QImage only, so it is safe to call from worker threads.
+    """
+    try:
+        cache_path = _thumb_cache_path(p, thumb_size, st)
+    except OSError:
+        cache_path = None
+    if cache_path is not None and cache_path.exists():
+        img = QImage(str(cache_path))
+        if not img.isNull():
+            return img
+
+    img = _decode_image(p, thumb_size)
+    if img is not None and cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(str(cache_path), "JPG", 85)
+        except Exception:
+            pass
+    return img
+
+def safe_pixmap_from_path(p: Path, thumb_size: QSize, st: os.stat_result = None) -> QPixmap | None:
+    """GUI-thread convenience wrapper around thumbnail_image()."""
+    img = thumbnail_image(p, thumb_size, st)
+    return QPixmap.fromImage(img) if img is not None else None
+
+def _tiff_thumb_array(p: Path, thumb_size: QSize) -> np.ndarray:
+    """
+    Read the smallest resolution level of a pyramidal TIFF, or just the first
+    page of a flat one, and downscale it (INTER_AREA) to fit 'thumb_size'.
+    """
+    # maxworkers=1: thumbnails are already decoded in parallel, one file per
+    # pool thread; tifffile's own per-strip threads would only oversubscribe
+    with tiff.TiffFile(str(p)) as tf:
+        series = tf.series[0]
+        if len(series.levels) > 1:
+            arr = series.levels[-1].asarray(maxworkers=1)
+        else:
+            arr = tf.pages[0].asarray(maxworkers=1)
+
+    if arr.ndim < 2:
+        return arr
+    h, w = arr.shape[:2]
+    scale = min(thumb_size.width() / w, thumb_size.height() / h, 1.0)
+    if scale < 1.0:
+        tw, th = max(1, round(w * scale)), max(1, round(h * scale))
+        if cv2 is not None and (arr.ndim == 2 or arr.shape[2] <= 4):
+            arr = cv2.resize(arr, (tw, th), interpolation=cv2.INTER_AREA)
+        else:
+            arr = arr[::max(1, h // th), ::max(1, w // tw)]  # nearest-neighbour fallback
+    return arr
+
+def _scaled_from_rgb8(rgb8: np.ndarray, thumb_size: QSize) -> QImage | None:
+    """Wrap an RGB8 array and return an independent scaled copy (or None).
+    The wrapper QImage borrows 'rgb8' without owning it, so whatever is
+    returned must own its pixels before 'rgb8' goes out of scope."""
+    rgb8 = np.ascontiguousarray(rgb8)  # stride must be exactly w*3
+    h, w = rgb8.shape[:2]
+    qimg = QImage(rgb8.data, w, h, w * 3, QImage.Format_RGB888)
+    if qimg.isNull():
         return None
+    scaled = qimg.scaled(thumb_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # scaled() allocates a new image, except when the size is unchanged: then
+    # it shares the borrowed buffer and needs the one explicit copy
+    return scaled.copy() if scaled.size() == qimg.size() else scaled
 
-def safe_pixmap_from_path(p: Path, thumb_size: QSize) -> QPixmap | None:
+def _decode_image(p: Path, thumb_size: QSize) -> QImage | None:
     """
-    Try to create a QPixmap thumbnail from file path:
-      1) QPixmap loader
-      2) tifffile → numpy → QImage → QPixmap
-      3) Pillow (PIL) → QImage → QPixmap
-      4) OpenCV → QImage → QPixmap
-    Returns a scaled QPixmap or None if all methods fail.
+    Try to create a QImage thumbnail from file path:
+      0) TIFF only: tifffile at reduced resolution (see _tiff_thumb_array)
+      1) QImageReader, scaled while decoding
+      2) tifffile → numpy → QImage
+      3) Pillow (PIL) → QImage
+      4) OpenCV → QImage
+    Returns a scaled QImage or None if all methods fail.
     """
-    # 1) Qt's native loader
-    pix = QPixmap(str(p))
-    if not pix.isNull():
-        return pix.scaled(thumb_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    # 0) TIFF: decode only the smallest pyramid level / first page and shrink
+    #    before conversion (Qt's loader would decode and convert full-res)
+    if tiff is not None and p.suffix.lower() in (".tif", ".tiff"):
+        try:
+            rgb8 = _to_rgb8(_tiff_thumb_array(p, thumb_size))
+            if rgb8 is not None:
+                img = _scaled_from_rgb8(rgb8, thumb_size)
+                if img is not None:
+                    return img
+        except Exception:
+            pass
+
+    # 1) Qt's native loader, scaling during decode (libjpeg's DCT scaling for
+    #    JPEG) instead of decoding full-res and shrinking afterwards
+    reader = QImageReader(str(p))
+    full = reader.size()
+    if full.isValid():
+        reader.setScaledSize(full.scaled(thumb_size, Qt.KeepAspectRatio))
+    img = reader.read()
+    if not img.isNull():
+        if img.size() != img.size().scaled(thumb_size, Qt.KeepAspectRatio):
+            img = img.scaled(thumb_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return img
 
     # 2) tifffile (best for scientific TIFF variants)
     if tiff is not None:
         try:
-            arr = tiff.imread(str(p))
-            rgb8 = _to_rgb8(arr)
+            rgb8 = _to_rgb8(tiff.imread(str(p), maxworkers=1))
             if rgb8 is not None:
-                h, w = rgb8.shape[:2]
-                qimg = QImage(rgb8.data, w, h, w * 3, QImage.Format_RGB888)
-                qp = QPixmap.fromImage(qimg)
-                if not qp.isNull():
-                    return qp.scaled(thumb_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                img = _scaled_from_rgb8(rgb8, thumb_size)
+                if img is not None:
+                    return img
         except Exception:
             pass
 
@@ -144,12 +288,9 @@ def safe_pixmap_from_path(p: Path, thumb_size: QSize) -> QPixmap | None:
         try:
             im = Image.open(str(p))
             im = im.convert("RGB")
-            rgb8 = np.array(im)
-            h, w = rgb8.shape[:2]
-            qimg = QImage(rgb8.data, w, h, w * 3, QImage.Format_RGB888)
-            qp = QPixmap.fromImage(qimg)
-            if not qp.isNull():
-                return qp.scaled(thumb_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            img = _scaled_from_rgb8(np.array(im), thumb_size)
+            if img is not None:
+                return img
         except Exception:
             pass
 
@@ -163,17 +304,246 @@ def safe_pixmap_from_path(p: Path, thumb_size: QSize) -> QPixmap | None:
                     bgr = cv2.cvtColor(bgr, cv2.COLOR_GRAY2BGR)
                 elif bgr.shape[-1] == 4:
                     bgr = bgr[:, :, :3]
-                rgb8 = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
-                h, w = rgb8.shape[:2]
-                qimg = QImage(rgb8.data, w, h, w * 3, QImage.Format_RGB888)
-                qp = QPixmap.fromImage(qimg)
-                if not qp.isNull():
-                    return qp.scaled(thumb_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                rgb8 = _to_rgb8(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB))
+                img = _scaled_from_rgb8(rgb8, thumb_size)
+                if img is not None:
+                    return img
         except Exception:
             pass
 
     return None
 
+# ---------- background thumbnail decoding ----------
+
+class _ThumbSignals(QObject):
+    done = Signal(int, int, object)  # generation, index, QImage or None
+
+
+class ThumbTask(QRunnable):
+    """Decode one thumbnail on a pool thread; QImage only (no QPixmap off-GUI)."""
+    def __init__(self, signals: _ThumbSignals, generation: int, index: int, path: Path,
+                 thumb_size: QSize, st: os.stat_result):
+        super().__init__()
+        self.signals = signals
+        self.generation, self.index = generation, index
+        self.path, self.thumb_size, self.st = path, thumb_size, st
+
+    def run(self):
+        try:
+            img = thumbnail_image(self.path, self.thumb_size, self.st)
+        except Exception:
+            img = None
+        self.signals.done.emit(self.generation, self.index, img)
+
+class ThumbnailModel(QAbstractListModel):
+    """Image list for the thumbnails view. A decode is queued the first time
+    the view asks for an item's icon; QListView only paints (and so only asks
+    for) items inside the viewport, so off-screen thumbnails are never decoded
+    until scrolled to."""
+    def __init__(self, pix_cache: OrderedDict, pool: QThreadPool, parent=None):
+        super().__init__(parent)
+        self._pix_cache = pix_cache  # shared LRU: (path, mtime_ns, w, h) -> QPixmap
+        self._pool = pool
+        self._signals = _ThumbSignals(self)
+        self._signals.done.connect(self._on_thumb_ready)
+        self._gen = 0           # bumped on every set_paths; stale results are ignored
+        self._paths: list[Path] = []
+        self._keys = {}         # row -> (LRU key, stat result)
+        self._pending = set()   # rows with a decode queued
+        self._failed = set()    # rows that could not be decoded
+        self._placeholder = QPixmap(THUMB_SIZE.width(), THUMB_SIZE.height() * 9 // 16)
+        self._placeholder.fill(Qt.darkGray)
+
+    def set_paths(self, paths: list[Path]):
+        self.beginResetModel()
+        self._gen += 1
+        self._pool.clear()  # drop decodes that haven't started
+        self._paths = list(paths)
+        self._keys, self._pending, self._failed = {}, set(), set()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        p = self._paths[row]
+        if role == Qt.DisplayRole:
+            return p.parent.name + "/" + p.name
+        if role in (Qt.ToolTipRole, Qt.UserRole):
+            return str(p)
+        if role == Qt.DecorationRole:
+            return self._icon(row, p)
+        return None
+
+    def _icon(self, row: int, p: Path):
+        if row in self._failed:
+            return None
+        if row not in self._keys:
+            try:
+                st = p.stat()
+            except OSError:
+                self._failed.add(row)
+                return None
+            self._keys[row] = ((str(p), st.st_mtime_ns, THUMB_SIZE.width(), THUMB_SIZE.height()), st)
+        key, st = self._keys[row]
+        qp = self._pix_cache.get(key)
+        if qp is not None:
+            self._pix_cache.move_to_end(key)
+            return qp
+        if row not in self._pending:
+            self._pending.add(row)
+            self._pool.start(ThumbTask(self._signals, self._gen, row, p, THUMB_SIZE, st))
+        return self._placeholder
+
+    def _on_thumb_ready(self, generation: int, row: int, img):
+        if generation != self._gen:
+            return  # selection/filter changed since this decode was queued
+        self._pending.discard(row)
+        if img is None:
+            self._failed.add(row)
+        else:
+            self._pix_cache[self._keys[row][0]] = QPixmap.fromImage(img)
+            if len(self._pix_cache) > THUMB_MEM_CACHE:
+                self._pix_cache.popitem(last=False)
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.DecorationRole])
+
+# ---------- background experiment scan ----------
+
+class _MetaScanSignals(QObject):
+    done = Signal(int, object, object, object, int)  # scan id, exp path, stamp, images, bytes
+
+
+class MetaScanTask(QRunnable):
+    """scan_experiment() off the GUI thread (large experiments / slow disks)."""
+    def __init__(self, signals: _MetaScanSignals, scan_id: int, exp_path: Path):
+        super().__init__()
+        self.signals, self.scan_id, self.exp_path = signals, scan_id, exp_path
+
+    def run(self):
+        stamp = dir_stamp(self.exp_path)
+        try:
+            images, size_bytes = scan_experiment(self.exp_path)
+        except Exception:
+            images, size_bytes = [], 0
+        self.signals.done.emit(self.scan_id, self.exp_path, stamp, images, size_bytes)
+
+# ---------- archive ----------
+
+def write_zip(exp_path: Path, dest: str):
+    """ZIP an experiment folder: images stored, text (CSV/JSON/logs) deflated
+    at level 1."""
+    with zipfile.ZipFile(dest, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        for root, _, files in os.walk(exp_path):
+            for f in files:
+                fp = os.path.join(root, f)
+                arcname = os.path.relpath(fp, exp_path)
+                if f.lower().endswith(ZIP_STORED_SUFFIXES):
+                    z.write(fp, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    z.write(fp, arcname)
+
+
+FICLONE = 0x40049409  # linux/fs.h: reflink ioctl (Btrfs/XFS share extents, no data copied)
+
+def _fast_copy(src, dst, *, follow_symlinks=True):
+    """copytree() copy_function: reflink clone, else in-kernel copy_file_range,
+    else shutil.copy2. Timestamps/mode are preserved like copy2."""
+    if sys.platform != "linux" or (not follow_symlinks and os.path.islink(src)):
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            sfd, dfd = fsrc.fileno(), fdst.fileno()
+            try:
+                if fcntl is None:
+                    raise OSError("no fcntl")
+                fcntl.ioctl(dfd, FICLONE, sfd)
+            except OSError:
+                remaining = os.fstat(sfd).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(sfd, dfd, remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+    except (OSError, AttributeError):
+        # e.g. EXDEV on older kernels, or no copy_file_range in this Python
+        return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+    shutil.copystat(src, dst)
+    return dst
+
+
+class _FileJobSignals(QObject):
+    done = Signal(str, object)  # result text, error message or None
+
+
+class FileJobTask(QRunnable):
+    """Run a long file operation (archive/export) off the GUI thread."""
+    def __init__(self, fn, *args, result: str = ""):
+        super().__init__()
+        self.signals = _FileJobSignals()
+        self.fn, self.args, self.result = fn, args, result
+
+    def run(self):
+        try:
+            self.fn(*self.args)
+            self.signals.done.emit(self.result, None)
+        except Exception as e:
+            self.signals.done.emit(self.result, str(e))
+
+# ---------- CSV table model ----------
+
+class CsvModel(QAbstractTableModel):
+    """Read-only view over parsed CSV rows; cells are only touched when the
+    table paints them, so no per-cell item objects are created."""
+    def __init__(self, header: list[str] = (), rows=(), parent=None):
+        """'rows' is a list of row lists (csv.reader) or a 2-D object ndarray (pandas)."""
+        super().__init__(parent)
+        self._header = list(header)
+        self._rows = rows
+        self._grid = isinstance(rows, np.ndarray)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._header)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if self._grid:
+            return self._rows[r, c]
+        row = self._rows[r]
+        return row[c] if c < len(row) else None  # short (truncated) rows
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._header[section] if section < len(self._header) else None
+        return section + 1
+
+def read_csv_rows(csv_path: Path):
+    """(header, rows) for CsvModel. Uses pandas' C parser when available and
+    falls back to csv.reader (also for files pandas rejects, e.g. ragged rows)."""
+    if pd is not None:
+        try:
+            df = pd.read_csv(csv_path, dtype=str, keep_default_na=False, engine="c")
+            return [str(h) for h in df.columns], df.to_numpy(dtype=object)
+        except pd.errors.EmptyDataError:
+            return [], []
+        except Exception:
+            pass
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    return (rows[0], rows[1:]) if rows else ([], [])
+
 # ---------- main dialog ----------
 
 class FileManagerDialog(QDialog):
@@ -208,8 +578,8 @@ class FileManagerDialog(QDialog):
         act_open = QAction("Open Folder", self); act_open.setShortcut(QKeySequence("Ctrl+O"))
         act_open.triggered.connect(self.open_folder); tb.addAction(act_open)
 
-        act_archive = QAction("Archive (ZIP)", self); act_archive.setShortcut(QKeySequence("Ctrl+Z"))
-        act_archive.triggered.connect(self.archive_selected); tb.addAction(act_archive)
+        self.act_archive = QAction("Archive (ZIP)", self); self.act_archive.setShortcut(QKeySequence("Ctrl+Z"))
+        self.act_archive.triggered.connect(self.archive_selected); tb.addAction(self.act_archive)
 
         act_export = QAction("Export to…", self); act_export.setShortcut(QKeySequence("Ctrl+E"))
         act_export.triggered.connect(self.export_selected); tb.addAction(act_export)
@@ -244,23 +614,45 @@ class FileManagerDialog(QDialog):
         dlay.addWidget(self.details_text)
         self.tabs.addTab(details_wrap, "Details")
 
-        # Thumbnails tab
-        self.thumb_scroll = QScrollArea(); self.thumb_scroll.setWidgetResizable(True)
-        self.thumb_container = QWidget()
-        self.thumb_grid = QGridLayout(self.thumb_container)
-        self.thumb_grid.setContentsMargins(8, 8, 8, 8); self.thumb_grid.setSpacing(8)
-        self.thumb_scroll.setWidget(self.thumb_container)
-        self.tabs.addTab(self.thumb_scroll, "Thumbnails")
+        # Thumbnails tab (model/view: only visible items are built and decoded)
+        thumbs_wrap = QWidget()
+        tlay = QVBoxLayout(thumbs_wrap); tlay.setContentsMargins(4, 4, 4, 4)
+        self.thumb_empty = QLabel("No images match the current filter.")
+        self.thumb_empty.setAlignment(Qt.AlignCenter)
+        self.thumb_empty.hide()
+        tlay.addWidget(self.thumb_empty)
+        self.thumb_view = QListView()
+        self.thumb_view.setViewMode(QListView.IconMode)
+        self.thumb_view.setIconSize(THUMB_SIZE)
+        self.thumb_view.setGridSize(QSize(THUMB_SIZE.width() + 16, THUMB_SIZE.height() * 9 // 16 + 48))
+        self.thumb_view.setResizeMode(QListView.Adjust)
+        self.thumb_view.setMovement(QListView.Static)
+        self.thumb_view.setUniformItemSizes(True)
+        self.thumb_view.setLayoutMode(QListView.Batched)
+        self.thumb_view.setBatchSize(32)
+        self.thumb_view.setWordWrap(True)
+        self.thumb_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # click-to-open
+        self.thumb_view.clicked.connect(lambda idx: self.open_image(idx.data(Qt.UserRole)))
+        tlay.addWidget(self.thumb_view)
+        self.tabs.addTab(thumbs_wrap, "Thumbnails")
 
         # CSV tab
         csv_wrap = QWidget()
         csv_layout = QVBoxLayout(csv_wrap); csv_layout.setContentsMargins(4, 4, 4, 4)
-        self.csv_table = QTableWidget()
+        self.csv_table = QTableView()
         self.csv_table.setAlternatingRowColors(True)
         self.csv_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.csv_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.csv_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        # Sorting goes through a proxy so the parsed rows are never reordered
+        self.csv_proxy = QSortFilterProxyModel(self)
+        self.csv_proxy.setSourceModel(CsvModel(parent=self))
+        self.csv_table.setModel(self.csv_proxy)
         self.csv_table.setSortingEnabled(True)
+        self.csv_table.sortByColumn(-1, Qt.AscendingOrder)  # file order until a header is clicked
+        # Column auto-fit looks at this many rows instead of every cell
+        self.csv_table.horizontalHeader().setResizeContentsPrecision(CSV_RESIZE_ROWS)
         csv_layout.addWidget(self.csv_table)
         self.tabs.addTab(csv_wrap, "CSV")
 
@@ -280,6 +672,35 @@ class FileManagerDialog(QDialog):
         btns.addStretch(); btns.addWidget(self.close_btn)
         main.addLayout(btns)
 
+        # Per-experiment scan results: path -> (dir_stamp, images newest-first, bytes)
+        self._exp_meta_cache: dict[Path, tuple[tuple, list[Path], int]] = {}
+
+        # In-memory LRU of scaled thumbnails: (path, mtime_ns, w, h) -> QPixmap
+        self._pix_cache: OrderedDict[tuple, QPixmap] = OrderedDict()
+
+        # Experiment scans: one at a time, queued scans for an older selection
+        # are discarded and finished ones still fill _exp_meta_cache
+        self._scan_pool = QThreadPool(self)
+        self._scan_pool.setMaxThreadCount(1)
+        self._scan_signals = _MetaScanSignals(self)
+        self._scan_signals.done.connect(self._on_meta_scanned)
+        self._current_scan_id = 0
+
+        self._images_by_plate = {}        # plate folder / "All plates" -> images
+        self._images_by_plate_src = None  # images list the buckets were built from
+
+        self._archive_task = None  # in-flight FileJobTask for archive_selected
+
+        # Thumbnails decode on a private pool (so pending work can be dropped)
+        self._thumb_pool = QThreadPool(self)
+        self.thumb_model = ThumbnailModel(self._pix_cache, self._thumb_pool, self)
+        self.thumb_view.setModel(self.thumb_model)
+
+        try:
+            THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+
         # Initial populate
         self.populate()
 
@@ -294,15 +715,37 @@ class FileManagerDialog(QDialog):
 
     def experiments(self) -> list[Path]:
         IMAGES_ROOT.mkdir(parents=True, exist_ok=True)
-        exps = [p for p in IMAGES_ROOT.iterdir() if p.is_dir() and p.name.startswith("experiment_")]
-        return sorted(exps, key=lambda x: x.stat().st_mtime, reverse=True)
+        exps = []
+        with os.scandir(IMAGES_ROOT) as it:
+            for e in it:
+                try:
+                    if e.name.startswith("experiment_") and e.is_dir():
+                        exps.append((e.stat().st_mtime, e.path))
+                except OSError:
+                    pass
+        exps.sort(reverse=True)
+        return [Path(p) for _, p in exps]
 
     def populate(self):
-        self.list_widget.clear()
-        for exp in self.experiments():
-            item = QListWidgetItem(exp.name); item.setData(Qt.UserRole, str(exp))
-            self.list_widget.addItem(item)
+        self._pix_cache.clear()  # explicit refresh: re-read thumbnails
+        for exp in [e for e in self._exp_meta_cache if not e.is_dir()]:
+            del self._exp_meta_cache[exp]
+        # One repaint for the whole rebuild; selection signals from clear() are
+        # pointless here since the panes are reset below anyway
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            for exp in self.experiments():
+                item = QListWidgetItem(exp.name); item.setData(Qt.UserRole, str(exp))
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
         self.disk_label.setText(self.disk_usage_text())
+        # Nothing is selected now: drop queued scans and orphan a running one
+        self._current_scan_id += 1
+        self._scan_pool.clear()
         self.details_text.clear()
         self.clear_thumbnails()
         self.clear_csv()
@@ -311,16 +754,44 @@ class FileManagerDialog(QDialog):
         items = self.list_widget.selectedItems()
         return Path(items[0].data(Qt.UserRole)) if items else None
 
+    def _cached_meta(self, exp_path: Path):
+        """(images newest first, folder bytes) if the cached scan is still
+        current (no change in the experiment or its plate folders), else None."""
+        hit = self._exp_meta_cache.get(exp_path)
+        if hit and hit[0] and hit[0] == dir_stamp(exp_path):
+            return hit[1], hit[2]
+        return None
+
     # ---- selection change: details + thumbnails + CSV ----
 
     def on_selection_changed(self):
+        self._current_scan_id += 1
         exp_path = self.selected_experiment_path()
         if not exp_path:
             self.details_text.clear(); self.clear_thumbnails(); self.clear_csv()
             return
 
-        images_all = list_images(exp_path)
-        size_bytes = folder_size(exp_path)
+        self.render_csv(exp_path)
+        cached = self._cached_meta(exp_path)
+        if cached is not None:
+            self.show_experiment(exp_path, *cached)
+            return
+
+        self.details_text.setPlainText(f"Experiment folder: {exp_path}\n\nScanning…")
+        self.clear_thumbnails()
+        self._scan_pool.clear()
+        self._scan_pool.start(
+            MetaScanTask(self._scan_signals, self._current_scan_id, exp_path)
+        )
+
+    def _on_meta_scanned(self, scan_id: int, exp_path: Path, stamp: tuple,
+                         images: list[Path], size_bytes: int):
+        if stamp and exp_path.is_dir():  # not if it was deleted mid-scan
+            self._exp_meta_cache[exp_path] = (stamp, images, size_bytes)
+        if scan_id == self._current_scan_id:
+            self.show_experiment(exp_path, images, size_bytes)
+
+    def show_experiment(self, exp_path: Path, images_all: list[Path], size_bytes: int):
         meta = exp_path / "metadata.json"
 
         lines = [
@@ -344,120 +815,76 @@ class FileManagerDialog(QDialog):
 
         self.details_text.setPlainText("\n".join(lines))
 
-        # Plate filter for thumbnails
+        # Plate filter for thumbnails: bucket by plate folder once per scan
+        # result, so flipping the filter is a dict lookup
+        if self._images_by_plate_src is not images_all:
+            by_plate = {"All plates": images_all}
+            for p in images_all:
+                by_plate.setdefault(p.parent.name.lower(), []).append(p)
+            self._images_by_plate = by_plate
+            self._images_by_plate_src = images_all
         filter_text = self.plate_filter.currentText()
-        if filter_text == "All plates":
-            images = images_all
-        else:
-            images = [p for p in images_all if p.parent.name.lower() == filter_text.lower()]
+        images = self._images_by_plate.get(
+            filter_text if filter_text == "All plates" else filter_text.lower(), [])
 
         self.render_thumbnails(images[:200])  # recent 200 thumbs
-        self.render_csv(exp_path)
 
     # ---- thumbnails ----
 
     def clear_thumbnails(self):
-        while self.thumb_grid.count():
-            item = self.thumb_grid.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        self.thumb_model.set_paths([])
+        self.thumb_empty.hide()
 
     def render_thumbnails(self, image_paths: list[Path]):
-        self.clear_thumbnails()
-        if not image_paths:
-            lbl = QLabel("No images match the current filter.")
-            lbl.setAlignment(Qt.AlignCenter)
-            self.thumb_grid.addWidget(lbl, 0, 0)
-            return
-
-        cols = 4
-        thumb_size = QSize(160, 160)
-        row = 0
-        col = 0
-
-        for p in image_paths:
-            frame = QFrame(); frame.setFrameShape(QFrame.StyledPanel)
-            v = QVBoxLayout(frame); v.setContentsMargins(4, 4, 4, 4); v.setSpacing(4)
-
-            qp = safe_pixmap_from_path(p, thumb_size)
-            if qp is None:
-                imlbl = QLabel("(preview unavailable)")
-                imlbl.setAlignment(Qt.AlignCenter)
-                v.addWidget(imlbl)
-            else:
-                imlbl = QLabel()
-                imlbl.setPixmap(qp)
-                imlbl.setAlignment(Qt.AlignCenter)
-                imlbl.setToolTip(str(p))
-                # click-to-open
-                imlbl.mousePressEvent = lambda e, fp=str(p): self.open_image(fp)
-                v.addWidget(imlbl)
-
-            cap = QLabel(p.parent.name + "/" + p.name)
-            cap.setWordWrap(True); cap.setAlignment(Qt.AlignCenter)
-            v.addWidget(cap)
-
-            self.thumb_grid.addWidget(frame, row, col)
-            col += 1
-            if col >= cols:
-                col = 0; row += 1
+        # Reset, empty-label toggle and scroll land as a single repaint
+        self.thumb_view.setUpdatesEnabled(False)
+        try:
+            self.thumb_model.set_paths(image_paths)
+            self.thumb_empty.setVisible(not image_paths)
+            self.thumb_view.scrollToTop()
+        finally:
+            self.thumb_view.setUpdatesEnabled(True)
 
     def open_image(self, filepath: str):
         try:
-            os.system(f'xdg-open "{filepath}" >/dev/null 2>&1 &')
+            open_external(filepath)
         except Exception as e:
             QMessageBox.warning(self, "Open Image", f"Failed to open image:\n{e}")
 
     # ---- CSV tab ----
 
     def clear_csv(self):
-        self.csv_table.clear()
-        self.csv_table.setRowCount(0)
-        self.csv_table.setColumnCount(0)
+        self._set_csv_model(CsvModel(parent=self))
+
+    def _set_csv_model(self, model: CsvModel):
+        old = self.csv_proxy.sourceModel()
+        self.csv_proxy.setSourceModel(model)
+        if old is not None:
+            old.deleteLater()
+
+    def _csv_message(self, text: str):
+        self._set_csv_model(CsvModel(["metadata.csv"], [[text]], self))
+        self.csv_table.resizeColumnsToContents()
 
     def render_csv(self, exp_path: Path):
         csv_path = exp_path / "metadata.csv"
-        self.clear_csv()
 
         if not csv_path.exists():
-            self.csv_table.setColumnCount(1)
-            self.csv_table.setRowCount(1)
-            self.csv_table.setHorizontalHeaderLabels(["metadata.csv"])
-            self.csv_table.setItem(0, 0, QTableWidgetItem("No metadata.csv found in this experiment."))
-            self.csv_table.resizeColumnsToContents()
+            self._csv_message("No metadata.csv found in this experiment.")
             return
 
         try:
-            with open(csv_path, "r", encoding="utf-8", newline="") as f:
-                reader = csv.reader(f)
-                rows = list(reader)
+            header, rows = read_csv_rows(csv_path)
         except Exception as e:
-            self.csv_table.setColumnCount(1)
-            self.csv_table.setRowCount(1)
-            self.csv_table.setHorizontalHeaderLabels(["metadata.csv"])
-            self.csv_table.setItem(0, 0, QTableWidgetItem(f"Failed to read CSV: {e}"))
-            self.csv_table.resizeColumnsToContents()
+            self._csv_message(f"Failed to read CSV: {e}")
             return
 
-        if not rows:
-            self.csv_table.setColumnCount(1)
-            self.csv_table.setRowCount(1)
-            self.csv_table.setHorizontalHeaderLabels(["metadata.csv"])
-            self.csv_table.setItem(0, 0, QTableWidgetItem("CSV is empty."))
-            self.csv_table.resizeColumnsToContents()
+        if not header:
+            self._csv_message("CSV is empty.")
             return
 
-        header = rows[0]
-        data_rows = rows[1:]
-
-        self.csv_table.setColumnCount(len(header))
-        self.csv_table.setHorizontalHeaderLabels(header)
-        self.csv_table.setRowCount(len(data_rows))
-        for r, row in enumerate(data_rows):
-            for c, cell in enumerate(row):
-                self.csv_table.setItem(r, c, QTableWidgetItem(cell))
-        self.csv_table.resizeColumnsToContents()
+        self._set_csv_model(CsvModel(header, rows, self))
+        self.csv_table.resizeColumnsToContents()  # samples CSV_RESIZE_ROWS rows, see __init__
 
     def open_csv_external(self):
         exp_path = self.selected_experiment_path()
@@ -469,7 +896,7 @@ class FileManagerDialog(QDialog):
             QMessageBox.information(self, "Open CSV", "metadata.csv not found in selected experiment.")
             return
         try:
-            os.system(f'xdg-open "{csv_path}" >/dev/null 2>&1 &')
+            open_external(csv_path)
         except Exception as e:
             QMessageBox.warning(self, "Open CSV", f"Failed to open CSV:\n{e}")
 
@@ -481,7 +908,7 @@ class FileManagerDialog(QDialog):
             QMessageBox.information(self, "Open Folder", "Please select an experiment.")
             return
         try:
-            os.system(f'xdg-open "{exp_path}" >/dev/null 2>&1 &')
+            open_external(exp_path)
         except Exception as e:
             QMessageBox.warning(self, "Open Folder", f"Failed to open folder:\n{e}")
 
@@ -494,16 +921,25 @@ class FileManagerDialog(QDialog):
         dest, _ = QFileDialog.getSaveFileName(self, "Save ZIP Archive", str(archive_name), "ZIP files (*.zip)")
         if not dest:
             return
-        try:
-            with zipfile.ZipFile(dest, "w", compression=zipfile.ZIP_DEFLATED) as z:
-                for root, _, files in os.walk(exp_path):
-                    for f in files:
-                        fp = Path(root) / f
-                        arcname = str(fp.relative_to(exp_path))
-                        z.write(fp, arcname)
+        # Compress on a pool thread; the dialog stays usable meanwhile
+        self._set_archiving(True)
+        task = FileJobTask(write_zip, exp_path, dest, result=dest)
+        task.signals.done.connect(self._on_archive_done)
+        self._archive_task = task  # keep the signals object alive until done
+        QThreadPool.globalInstance().start(task)
+
+    def _set_archiving(self, busy: bool):
+        self.act_archive.setEnabled(not busy)
+        self.archive_btn.setEnabled(not busy)
+        self.archive_btn.setText("Archiving…" if busy else "Archive (ZIP)")
+
+    def _on_archive_done(self, dest: str, error):
+        self._archive_task = None
+        self._set_archiving(False)
+        if error is None:
             QMessageBox.information(self, "Archive", f"Archived to:\n{dest}")
-        except Exception as e:
-            QMessageBox.warning(self, "Archive", f"Failed to archive:\n{e}")
+        else:
+            QMessageBox.warning(self, "Archive", f"Failed to archive:\n{error}")
 
     def export_selected(self):
         exp_path = self.selected_experiment_path()
@@ -528,7 +964,7 @@ class FileManagerDialog(QDialog):
                 QMessageBox.warning(self, "Export", f"Failed to remove existing folder:\n{e}")
                 return
         try:
-            shutil.copytree(exp_path, dest)
+            shutil.copytree(exp_path, dest, copy_function=_fast_copy)
             QMessageBox.information(self, "Export", f"Exported to:\n{dest}")
         except Exception as e:
             QMessageBox.warning(self, "Export", f"Export failed:\n{e}")
@@ -547,6 +983,7 @@ class FileManagerDialog(QDialog):
             return
         try:
             shutil.rmtree(exp_path)
+            clear_thumbcache()  # drop thumbnails of the deleted images
             self.populate()
             QMessageBox.information(self, "Delete", "Experiment deleted.")
         except Exception as e:
@@ -1,37 +1,25 @@
 #gui.py
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QDialog
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QPixmap
-from styles import dark_style
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QPlainTextEdit, QDialog
+from PySide6.QtCore import Qt, QThread, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QPixmap, QImage
+from styles import dark_style, set_style_property
 from experiment_setup import ExperimentSetupDialog, ILLUM_GREEN, ILLUM_IR
 from experiment_runner import ExperimentRunner
 from camera_config import CameraConfigDialog
 from file_manager import FileManagerDialog
+import threading
+import time
+import zlib
 import motor_control
 import camera
 
-# --- Constants for LED colors/styles ---
-SEA_FOAM_GREEN = "#26A69A"  # Green mode button color
-DEEP_RED = "#B71C1C"        # Infrared mode button color
-
-# LED GPIO setup (best-effort)
-try:
-    import gpiod
-    from gpiod.line import Value, Direction
-    LED_GREEN_PIN = 12
-    LED_IR_PIN = 13
-    chip = "/dev/gpiochip0"
-    led_request = gpiod.request_lines(
-        chip,
-        consumer="seedling_leds",
-        config={
-            LED_GREEN_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
-            LED_IR_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
-        }
-    )
-except Exception as e:
-    print(f"LED init failed: {e}", flush=True)
-    led_request = None
+PREVIEW_INTERVAL_S = 0.1  # Live View frame period (10 fps)
+LOG_MAX_LINES = 500       # log panel keeps only the newest lines
+LOG_FLUSH_MS = 1000       # image-saved lines are appended in batches this often
+STATUS_FLUSH_S = 0.05     # motor workers send at most one status batch per window
+
+# Illumination mode -> (green_on, ir_on) when lit
+_MODE_LEDS = {ILLUM_GREEN: (True, False), ILLUM_IR: (False, True)}
 
 
 class SeedlingImagerGUI(QWidget):
@@ -41,7 +29,6 @@ class SeedlingImagerGUI(QWidget):
         self.setFixedSize(800, 480)
         self.setStyleSheet(dark_style)
 
-        self.threads = []
         self.experiment_thread = None
         self.homing_worker = None  # <-- abortable homing worker
         self.active_illum_mode = ILLUM_GREEN
@@ -56,19 +43,20 @@ class SeedlingImagerGUI(QWidget):
 
         self.live_view_btn = QPushButton("Live View")
         self.live_view_btn.setFixedWidth(button_width)
-        self.live_view_btn.setStyleSheet(dark_style + " QPushButton { background-color: #FFD600; color: black; }")
+        self.live_view_btn.setObjectName("liveViewBtn")  # colors per state in dark_style
         self.live_view_btn.clicked.connect(self.toggle_live_view)
         button_layout.addWidget(self.live_view_btn)
 
         self.illum_toggle_btn = QPushButton(f"Illum: {self.active_illum_mode}")
         self.illum_toggle_btn.setFixedWidth(button_width)
+        self.illum_toggle_btn.setObjectName("illumToggle")
         self.apply_main_illum_style()
         self.illum_toggle_btn.clicked.connect(self.toggle_illumination_mode)
         button_layout.addWidget(self.illum_toggle_btn)
 
         ha_layout = QHBoxLayout()
         self.home_btn = QPushButton("Home");    self.home_btn.setFixedWidth(button_width // 2 - 5)
-        self.home_btn.setObjectName("homeBtn")  # precise styling when in STOP state
+        self.home_btn.setObjectName("homeBtn")  # red while in STOP state (dark_style)
         self.advance_btn = QPushButton("Advance"); self.advance_btn.setFixedWidth(button_width // 2 - 5)
         ha_layout.addWidget(self.home_btn); ha_layout.addWidget(self.advance_btn)
 
@@ -80,28 +68,26 @@ class SeedlingImagerGUI(QWidget):
 
         self.experiment_btn = QPushButton("Experiment Setup")
         self.experiment_btn.setFixedWidth(button_width)
-        self.experiment_btn.setStyleSheet(dark_style + " QPushButton { background-color: #8E24AA; color: white; }")
+        self.experiment_btn.setObjectName("experimentBtn")
         self.experiment_btn.clicked.connect(self.open_experiment_setup)
         button_layout.addWidget(self.experiment_btn)
 
         self.end_experiment_btn = QPushButton("End Experiment")
         self.end_experiment_btn.setFixedWidth(button_width)
-        self.end_experiment_btn.setStyleSheet(dark_style + " QPushButton { background-color: #E53935; color: white; }")
+        self.end_experiment_btn.setObjectName("endExperimentBtn")
         self.end_experiment_btn.clicked.connect(self.end_experiment)
         button_layout.addWidget(self.end_experiment_btn)
 
         # Camera Config button
         self.camera_config_btn = QPushButton("Camera Config")
         self.camera_config_btn.setFixedWidth(button_width)
-        self.camera_config_btn.setStyleSheet(dark_style + " QPushButton { background-color: #546E7A; color: white; }")
+        self.camera_config_btn.setObjectName("cameraConfigBtn")
         self.camera_config_btn.clicked.connect(self.open_camera_config)
         button_layout.addWidget(self.camera_config_btn)
 
         self.file_manager_btn = QPushButton("File Manager")
         self.file_manager_btn.setFixedWidth(button_width)
-        self.file_manager_btn.setStyleSheet(
-            dark_style + " QPushButton { background-color: #455A64; color: white; }"
-        )
+        self.file_manager_btn.setObjectName("fileManagerBtn")
         self.file_manager_btn.clicked.connect(self.open_file_manager)
         button_layout.addWidget(self.file_manager_btn)
 
@@ -113,29 +99,56 @@ class SeedlingImagerGUI(QWidget):
         right_layout.addWidget(self.status_label)
 
         self.camera_label = QLabel("Camera Preview"); self.camera_label.setAlignment(Qt.AlignCenter)
-        self.camera_label.setFixedSize(512, 288)
+        self.camera_label.setFixedSize(*camera.PREVIEW_SIZE)  # lores frames map 1:1
         right_layout.addWidget(self.camera_label, alignment=Qt.AlignRight)
 
-        self.log_panel = QTextEdit(); self.log_panel.setReadOnly(True)
+        # Plain-text, line-oriented log (no rich-text layout per append)
+        self.log_panel = QPlainTextEdit(); self.log_panel.setReadOnly(True)
+        # Multi-day runs: drop the oldest lines instead of growing without bound
+        self.log_panel.setMaximumBlockCount(LOG_MAX_LINES)
+        self._log_pending = []
+        self._log_timer = QTimer(self); self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log_panel)
         right_layout.addWidget(self.log_panel)
 
         main_layout.addLayout(right_layout)
         self.setLayout(main_layout)
 
-        self.timer = QTimer(); self.timer.timeout.connect(self.update_camera_frame)
+        self.camera_worker = None  # CameraWorker while Live View is on
+        # Two preview pixmaps used alternately: the label keeps a shared
+        # reference to the one it shows, so converting into that one would
+        # force a detach (fresh allocation); the other is ours alone
+        self._preview_pixmaps = (QPixmap(self.camera_label.size()), QPixmap(self.camera_label.size()))
+        self._preview_idx = 0
+        self._last_frame_crc = None  # CRC-32 of the frame currently shown
         self.live_view_active = False
-
+        self._camera_starting = None  # Event of the in-flight LiveViewStartTask
+        self._ending = False  # End Experiment pressed, runner still unwinding
+        self._pending_experiment = None  # (plates, days, freq, illum) while preview homing runs
+
+        # Controls disabled while an experiment runs
+        self._exp_sensitive = (
+            self.live_view_btn, self.home_btn, self.advance_btn,
+            self.experiment_btn, self.illum_toggle_btn, self.camera_config_btn,
+        )
         self.update_controls_for_experiment(False)
+        motor_control.get_request()  # claim the GPIO lines now: LEDs off, driver enabled, clockwise
 
-        # Apply persisted camera settings at startup
-        camera.apply_settings()
+        # Apply persisted camera settings at startup off the GUI thread, so
+        # the window paints right away; Live View waits until they are in
+        self.live_view_btn.setEnabled(False)
+        settings_task = ApplySettingsTask()
+        settings_task.signals.settings_applied.connect(self._on_settings_applied, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(settings_task)
+
+    def _on_settings_applied(self):
+        self.live_view_btn.setEnabled(not self.end_experiment_btn.isEnabled())
+        self.update_status("Camera settings applied.")
 
     # ---------- Illumination ----------
     def apply_main_illum_style(self):
-        color = "#26A69A" if self.active_illum_mode == ILLUM_GREEN else "#B71C1C"
-        self.illum_toggle_btn.setStyleSheet(
-            dark_style + f" QPushButton {{ background-color: {color}; color: white; font-weight: bold; }}"
-        )
+        # Colors live in dark_style (QPushButton#illumToggle[illum=...])
+        set_style_property(self.illum_toggle_btn, "illum", self.active_illum_mode)
 
     def toggle_illumination_mode(self):
         """Switch between Green and Infrared illumination; update button style."""
@@ -143,20 +156,14 @@ class SeedlingImagerGUI(QWidget):
         self.illum_toggle_btn.setText(f"Illum: {self.active_illum_mode}")
         self.apply_main_illum_style()
         # If live view is active, apply the new illumination immediately
-        if self.live_view_active and led_request:
-            from gpiod.line import Value  # import only when needed
-            if self.active_illum_mode == ILLUM_GREEN:
-                led_request.set_value(LED_GREEN_PIN, Value.ACTIVE)
-                led_request.set_value(LED_IR_PIN, Value.INACTIVE)
-            else:
-                led_request.set_value(LED_GREEN_PIN, Value.INACTIVE)
-                led_request.set_value(LED_IR_PIN, Value.ACTIVE)
+        if self.live_view_active:
+            motor_control.set_leds(*_MODE_LEDS[self.active_illum_mode])
         self.update_status(f"Illumination set to {self.active_illum_mode}")
 
     # ---------- Home/Stop logic (manual use via Home button) ----------
     def on_home_clicked(self):
         """Toggle behavior: start homing or request stop."""
-        if self.homing_worker is None or not self.homing_worker.isRunning():
+        if self.homing_worker is None:
             self.start_homing()
         else:
             self.stop_homing()
@@ -165,9 +172,9 @@ class SeedlingImagerGUI(QWidget):
         # Ensure driver is enabled before motion (EN low = enabled per wiring)
         motor_control.driver_enable()  # enable driver  [1](https://uwprod-my.sharepoint.com/personal/sybednar_wisc_edu/Documents/Microsoft%20Copilot%20Chat%20Files/git_update.sh.txt)
 
-        # Update UI to STOP state (direct, per-widget style to override app-wide blue)
+        # Update UI to STOP state
         self.home_btn.setText("STOP")
-        self.home_btn.setStyleSheet("background-color: #E53935; color: white; font-weight: bold;")
+        set_style_property(self.home_btn, "state", "stop")
         # Disable potentially conflicting controls during homing (keep Home enabled for STOP)
         self.advance_btn.setEnabled(False)
         self.experiment_btn.setEnabled(False)
@@ -176,22 +183,22 @@ class SeedlingImagerGUI(QWidget):
 
         # Launch worker
         self.homing_worker = HomingWorker()
-        self.homing_worker.status_signal.connect(self.update_status)
-        self.homing_worker.finished_with_result.connect(self.on_homing_finished)
-        self.homing_worker.start()
+        self.homing_worker.signals.status_signal.connect(self.update_status, Qt.QueuedConnection)
+        self.homing_worker.signals.finished_with_result.connect(self.on_homing_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self.homing_worker)
         self.update_status("Homing started...")
 
     def stop_homing(self):
         # Immediate hardware e-stop: cut coil current now (EN high = disabled)
         motor_control.driver_disable()  # disable driver  [1](https://uwprod-my.sharepoint.com/personal/sybednar_wisc_edu/Documents/Microsoft%20Copilot%20Chat%20Files/git_update.sh.txt)
-        if self.homing_worker and self.homing_worker.isRunning():
+        if self.homing_worker:
             self.homing_worker.request_stop()
             self.update_status("Emergency stop requested... (driver disabled)")
 
     def on_homing_finished(self, plate_or_none):
         # Restore UI to normal state
         self.home_btn.setText("Home")
-        self.home_btn.setStyleSheet("")  # clear per-widget override; fallback to app-wide blue
+        set_style_property(self.home_btn, "state", "")  # back to app-wide blue
         self.advance_btn.setEnabled(True)
         self.experiment_btn.setEnabled(True)
         self.illum_toggle_btn.setEnabled(True)
@@ -206,12 +213,20 @@ class SeedlingImagerGUI(QWidget):
             # Keep driver enabled after normal completion (holding torque).
             self.update_status("Homing finished. Driver remains ENABLED.")
 
+    # ---------- One-shot motor actions (Advance button) ----------
+    def run_motor_action(self, action: str):
+        worker = MotorWorker(action)
+        worker.signals.status_signal.connect(self.update_status, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+
     # ---------- Homing-with-preview right before starting an experiment ----------
     def open_experiment_setup(self):
-        if self.live_view_active:
-            self.toggle_live_view()
+        paused = self._pause_preview()
         dialog = ExperimentSetupDialog(self)
-        if dialog.exec() == QDialog.Accepted:
+        accepted = dialog.exec() == QDialog.Accepted
+        if paused:
+            self._resume_preview()
+        if accepted:
             # Run homing with preview first, then launch the runner
             self.start_experiment_with_homing_preview(
                 plates=dialog.selected_plates,
@@ -230,15 +245,18 @@ class SeedlingImagerGUI(QWidget):
         self.active_illum_mode = illum
         self.apply_main_illum_style()
 
-        # Turn on Live View (sets LEDs for the chosen mode)
+        # Turn on Live View (sets LEDs for the chosen mode); if it was kept
+        # running across the setup dialog, just switch LEDs to the chosen mode
         if not self.live_view_active:
             self.toggle_live_view()
+        else:
+            motor_control.set_leds(*_MODE_LEDS[self.active_illum_mode])
         self.update_status("Starting homing (with preview)... Press STOP to abort if needed.")
 
         # Ensure driver enabled, set Home button to STOP style, and disable other controls
         motor_control.driver_enable()  # enable driver  [1](https://uwprod-my.sharepoint.com/personal/sybednar_wisc_edu/Documents/Microsoft%20Copilot%20Chat%20Files/git_update.sh.txt)
         self.home_btn.setText("STOP")
-        self.home_btn.setStyleSheet("background-color: #E53935; color: white; font-weight: bold;")
+        set_style_property(self.home_btn, "state", "stop")
         self.advance_btn.setEnabled(False)
         self.experiment_btn.setEnabled(False)
         self.illum_toggle_btn.setEnabled(False)
@@ -246,19 +264,18 @@ class SeedlingImagerGUI(QWidget):
 
         # Launch a dedicated homing worker
         self.homing_worker = HomingWorker()
-        self.homing_worker.status_signal.connect(self.update_status)
+        self.homing_worker.signals.status_signal.connect(self.update_status, Qt.QueuedConnection)
         # When homing completes, continue to experiment or abort
-        self.homing_worker.finished_with_result.connect(
-            lambda plate_or_none: self._on_preview_homing_done(
-                plate_or_none, plates, days, freq, illum
-            )
-        )
-        self.homing_worker.start()
+        self._pending_experiment = (plates, days, freq, illum)
+        self.homing_worker.signals.finished_with_result.connect(self._on_preview_homing_done, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self.homing_worker)
 
-    def _on_preview_homing_done(self, plate_or_none, plates, days, freq, illum):
+    def _on_preview_homing_done(self, plate_or_none):
+        plates, days, freq, illum = self._pending_experiment
+        self._pending_experiment = None
         # Restore Home button and re-enable the controls disabled for the preview-homing step
         self.home_btn.setText("Home")
-        self.home_btn.setStyleSheet("")
+        set_style_property(self.home_btn, "state", "")
         self.advance_btn.setEnabled(True)
         self.experiment_btn.setEnabled(True)
         self.illum_toggle_btn.setEnabled(True)
@@ -292,171 +309,375 @@ class SeedlingImagerGUI(QWidget):
         self.experiment_thread = ExperimentRunner(
             plates, days, freq, illum, self.set_led, perform_homing=(not skip_initial_homing)
         )
-        self.experiment_thread.status_signal.connect(self.update_status)
-        self.experiment_thread.image_saved_signal.connect(lambda p: self.log_panel.append(f"Image saved: {p}"))
-        self.experiment_thread.plate_signal.connect(lambda idx: self.status_label.setText(f"Plate #{idx}"))
-        self.experiment_thread.finished_signal.connect(self.on_experiment_finished)
+        # Emitted from the runner (and its writer) threads; bound methods so
+        # every slot runs on the GUI thread
+        self.experiment_thread.status_signal.connect(self.update_status, Qt.QueuedConnection)
+        self.experiment_thread.image_saved_signal.connect(self._on_image_saved, Qt.QueuedConnection)
+        self.experiment_thread.plate_signal.connect(self._on_plate_changed, Qt.QueuedConnection)
+        self.experiment_thread.finished_signal.connect(self.on_experiment_finished, Qt.QueuedConnection)
         self.update_controls_for_experiment(True)
         self.experiment_thread.start()
 
+    def _on_image_saved(self, path):
+        self.queue_log(f"Image saved: {path}")
+
+    def _on_plate_changed(self, idx):
+        self.status_label.setText(f"Plate #{idx}")
+
     def end_experiment(self):
         if self.experiment_thread and self.experiment_thread.isRunning():
-            self.experiment_thread.abort(); self.experiment_thread.wait()
-            self.update_status("Experiment ended by user.")
+            # No wait() here: the runner unwinds on its own thread and its
+            # finished_signal (on_experiment_finished) does the teardown
+            self._ending = True
+            self.end_experiment_btn.setEnabled(False)
+            self.experiment_thread.abort()
+            self.update_status("Ending experiment...")
         else:
             self.update_status("No experiment running.")
-        self.update_controls_for_experiment(False)
+            self.update_controls_for_experiment(False)
 
     def on_experiment_finished(self):
         self.update_controls_for_experiment(False)
-        self.update_status("Experiment finished.")
+        motor_control.set_leds(False, False)
+        if self._ending:
+            self._ending = False
+            self.update_status("Experiment ended by user.")
+        else:
+            self.update_status("Experiment finished.")
 
     def update_controls_for_experiment(self, running: bool):
         """Enable/disable controls while an experiment is running."""
-        # Live View and motion/Config controls should be disabled during a run
-        self.live_view_btn.setEnabled(not running)
-        self.home_btn.setEnabled(not running)
-        self.advance_btn.setEnabled(not running)
-        self.experiment_btn.setEnabled(not running)
-        self.illum_toggle_btn.setEnabled(not running)
-        self.camera_config_btn.setEnabled(not running)
-        # Only the "End Experiment" button is enabled during a run
-        self.end_experiment_btn.setEnabled(running)
+        # One repaint for the whole batch of enable-state changes
+        self.setUpdatesEnabled(False)
+        try:
+            # Live View and motion/Config controls should be disabled during a run
+            for w in self._exp_sensitive:
+                w.setEnabled(not running)
+            # Only the "End Experiment" button is enabled during a run
+            self.end_experiment_btn.setEnabled(running)
+        finally:
+            self.setUpdatesEnabled(True)
 
     # ---------- Camera / LEDs / File manager ----------
     def update_status(self, text):
-        self.status_label.setText(text)
-        self.log_panel.append(text)
+        # Runner status may arrive as a batch of lines; the label shows the latest
+        self.status_label.setText(text.rsplit("\n", 1)[-1])
+        self._flush_log_panel()  # keep queued lines in order ahead of this one
+        self.log_panel.appendPlainText(text)
+
+    def queue_log(self, line):
+        """Append to the log panel in batches (at most one append per LOG_FLUSH_MS)."""
+        self._log_pending.append(line)
+        if not self._log_timer.isActive():
+            self._log_timer.start(LOG_FLUSH_MS)
+
+    def _flush_log_panel(self):
+        self._log_timer.stop()
+        if self._log_pending:
+            self.log_panel.appendPlainText("\n".join(self._log_pending))
+            self._log_pending.clear()
 
     def toggle_live_view(self):
         if not self.live_view_active:
-            camera.start_camera()
-            camera.set_af_mode(2)  # Continuous AF for preview
-            self.timer.start(100)
             self.live_view_active = True
-            self.live_view_btn.setStyleSheet(dark_style + " QPushButton { background-color: #43A047; color: white; }")
-            self.update_status(f"Live View started. {self.active_illum_mode} LED ON.")
+            # The pipeline start can take a second or more, so it runs on the
+            # pool; the button stays disabled until the camera is up, so
+            # extra taps can't queue a redundant stop/start
+            self.live_view_btn.setEnabled(False)
+            task = LiveViewStartTask()
+            self._camera_starting = task.done
+            task.signals.started.connect(self._on_live_view_started, Qt.QueuedConnection)
+            QThreadPool.globalInstance().start(task)
+            set_style_property(self.live_view_btn, "state", "on")
             # Turn ON selected illumination
-            if led_request:
-                from gpiod.line import Value
-                if self.active_illum_mode == ILLUM_GREEN:
-                    led_request.set_value(LED_GREEN_PIN, Value.ACTIVE)
-                    led_request.set_value(LED_IR_PIN, Value.INACTIVE)
-                else:
-                    led_request.set_value(LED_GREEN_PIN, Value.INACTIVE)
-                    led_request.set_value(LED_IR_PIN, Value.ACTIVE)
+            motor_control.set_leds(*_MODE_LEDS[self.active_illum_mode])
         else:
-            self.timer.stop()
+            self._pause_preview()  # returns once no capture is in progress
+            if self._camera_starting is not None:
+                self._camera_starting.wait()  # stop only once the start is done
+                self._camera_starting = None
             camera.stop_camera()
             self.live_view_active = False
-            self.live_view_btn.setStyleSheet(dark_style + " QPushButton { background-color: #FFD600; color: black; }")
+            set_style_property(self.live_view_btn, "state", "")
             self.update_status("Live View stopped.")
             # Turn OFF both LEDs
-            if led_request:
-                from gpiod.line import Value
-                led_request.set_value(LED_GREEN_PIN, Value.INACTIVE)
-                led_request.set_value(LED_IR_PIN, Value.INACTIVE)
-
-    def update_camera_frame(self):
-        frame = camera.get_frame()
-        pixmap = QPixmap.fromImage(frame)
-        self.camera_label.setPixmap(pixmap.scaled(self.camera_label.size(), Qt.KeepAspectRatio))
+            motor_control.set_leds(False, False)
+
+    def _on_live_view_started(self, done):
+        self.live_view_btn.setEnabled(not self.end_experiment_btn.isEnabled())
+        if done is not self._camera_starting:
+            return  # Live View was stopped again while the camera started
+        self._camera_starting = None
+        # Frames are captured on a worker thread and delivered (queued) to
+        # update_camera_frame, so a slow capture never stalls the GUI
+        self._resume_preview()
+        self.update_status(f"Live View started. {self.active_illum_mode} LED ON.")
+
+    def _pause_preview(self) -> bool:
+        """Stop delivering Live View frames but leave the camera streaming, so
+        resuming after a modal dialog is instant. True if it was running."""
+        if not self.camera_worker:
+            return False
+        self.camera_worker.stop()
+        self.camera_worker = None
+        return True
+
+    def _resume_preview(self):
+        if self.live_view_active and self._camera_starting is None and not self.camera_worker:
+            self.camera_worker = CameraWorker()
+            self.camera_worker.frame_ready.connect(self.update_camera_frame, Qt.QueuedConnection)
+            self.camera_worker.start()
+
+    def update_camera_frame(self, frame: QImage):
+        # A frame still queued from a worker stopped by pause/resume: drop it
+        # (stop() already released that worker) and don't release the new one
+        w = self.sender()
+        if w is None or w is not self.camera_worker:
+            return
+        try:
+            if frame.isNull() or self.camera_label.visibleRegion().isEmpty():
+                return  # minimized/covered: don't convert frames nobody sees
+            # Static scene (e.g. plate settle): a byte-identical frame would
+            # repaint the same picture. CRC over the whole buffer, not just a
+            # header, so a change anywhere in the frame is caught
+            crc = zlib.crc32(frame.constBits())
+            if crc == self._last_frame_crc:
+                return
+            self._last_frame_crc = crc
+            self._preview_idx ^= 1
+            pm = self._preview_pixmaps[self._preview_idx]
+            pm.convertFromImage(frame, Qt.NoFormatConversion)
+            self.camera_label.setPixmap(pm)
+        finally:
+            # 'frame' wraps a camera buffer; let the worker that sent it reuse it
+            w.frame_consumed()
 
     def open_camera_config(self):
-        if self.live_view_active:
-            self.toggle_live_view()  # Stop live preview while changing settings
+        paused = self._pause_preview()  # camera keeps streaming; no cold restart
         dialog = CameraConfigDialog(current_settings=camera.get_current_settings(), parent=self)
         if dialog.exec() == QDialog.Accepted:
             # Dialog saves settings to JSON internally
             camera.apply_settings(dialog.settings)
             self.update_status("Camera settings applied.")
-            # Optionally restart Live View so user can see effect immediately
-            # self.toggle_live_view()  # Uncomment if desired
+        if paused:
+            self._resume_preview()  # shows the new settings immediately
 
     def set_led(self, on: bool, mode: str):
         """LED control helper passed to ExperimentRunner."""
-        if not led_request:
-            return
-        from gpiod.line import Value
-        if mode == ILLUM_GREEN:
-            led_request.set_value(LED_GREEN_PIN, Value.ACTIVE if on else Value.INACTIVE)
-            led_request.set_value(LED_IR_PIN, Value.INACTIVE)
-        else:
-            led_request.set_value(LED_GREEN_PIN, Value.INACTIVE)
-            led_request.set_value(LED_IR_PIN, Value.ACTIVE if on else Value.INACTIVE)
+        motor_control.set_leds(*_MODE_LEDS[mode] if on else (False, False))
 
     def open_file_manager(self):
-        # Stop Live View to avoid racing the camera while user manages files (optional)
-        if self.live_view_active:
-            self.toggle_live_view()
+        # Pause preview frames while the user manages files (camera stays warm).
+        # Live View's illumination is switched off for that time too: nothing
+        # is being viewed, and the seedlings shouldn't sit under the LEDs
+        paused = self._pause_preview()
+        lit = self.live_view_active  # experiments keep Live View (and its LEDs) off
+        if lit:
+            motor_control.set_leds(False, False)
         dlg = FileManagerDialog(self)
         dlg.exec()
+        if lit and self.live_view_active:
+            motor_control.set_leds(*_MODE_LEDS[self.active_illum_mode])
+        if paused:
+            self._resume_preview()
 
     def closeEvent(self, event):
         # Graceful shutdown
         if self.experiment_thread and self.experiment_thread.isRunning():
             self.experiment_thread.abort()
             self.experiment_thread.wait()
-        if self.homing_worker and self.homing_worker.isRunning():
+        if self.homing_worker:
             self.stop_homing()
-            self.homing_worker.wait()
+        # Homing and motor runnables share the global pool
+        QThreadPool.globalInstance().waitForDone(2000)
         if self.live_view_active:
             self.toggle_live_view()
+        # The driver stays enabled (holding torque) between moves for the
+        # whole session; release it only on exit
+        motor_control.driver_disable()
         event.accept()
 
 
-# Abortable homing worker
-class HomingWorker(QThread):
+# Live View frame producer
+class CameraWorker(QThread):
+    """Capture lores frames off the GUI thread at PREVIEW_INTERVAL_S, already
+    at the preview label's size.
+    camera.get_frame() wraps one of two reused buffers, so only one frame is
+    in flight: the next capture waits until the GUI calls frame_consumed()."""
+    frame_ready = Signal(QImage)
+
+    def __init__(self):
+        super().__init__()
+        self._stop = threading.Event()
+        self._consumed = threading.Event()
+
+    def frame_consumed(self):
+        self._consumed.set()
+
+    def stop(self):
+        self._stop.set()
+        self._consumed.set()
+        self.wait()
+
+    def run(self):
+        next_t = time.monotonic()
+        w, h = camera.PREVIEW_SIZE  # the preview label's fixed size
+        while not self._stop.is_set():
+            frame = camera.get_frame()
+            if not frame.isNull() and (frame.width() != w or frame.height() != h):
+                # Only if the lores stream doesn't match the label (other
+                # sensor/config); resampled here, not on the GUI thread
+                frame = frame.scaled(w, h, Qt.KeepAspectRatio, Qt.FastTransformation)
+            self.frame_ready.emit(frame)
+            self._consumed.wait()   # stop() also sets it
+            self._consumed.clear()  # _stop is re-checked before the next emit
+            next_t += PREVIEW_INTERVAL_S
+            delay = next_t - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                next_t = time.monotonic()  # fell behind; don't try to catch up
+
+
+class _StatusBatcher:
+    """
+    Worker-side status callback. A line is sent at once unless one went out
+    less than STATUS_FLUSH_S ago; lines in such a burst are joined and sent
+    when the window ends (a timer flushes them even if no further line comes,
+    e.g. during a long drift seek). flush() sends the remainder.
+    """
+    def __init__(self, signal):
+        self._emit = signal.emit
+        self._pending = []
+        self._last = float("-inf")
+        self._timer = None
+        self._lock = threading.Lock()  # the timer flushes from its own thread
+
+    def __call__(self, msg):
+        with self._lock:
+            self._pending.append(msg)
+            wait = self._last + STATUS_FLUSH_S - time.monotonic()
+            if wait > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending:
+                # Emitted under the lock so batches keep their order
+                self._emit("\n".join(self._pending))
+                self._pending.clear()
+                self._last = time.monotonic()
+
+
+class _HomingSignals(QObject):
     status_signal = Signal(str)
     finished_with_result = Signal(object)  # plate index (int) on success, or None
 
+
+# Abortable homing on the global QThreadPool (a warm thread, not a new QThread
+# per press); the GUI drops its reference in the finished_with_result slot
+class HomingWorker(QRunnable):
     def __init__(self):
         super().__init__()
-        self._abort = False
+        self.setAutoDelete(False)  # the GUI keeps it for request_stop()
+        self.signals = _HomingSignals()
+        self._abort_event = threading.Event()
 
     def request_stop(self):
-        self._abort = True
-
-    def _should_abort(self):
-        return self._abort
+        self._abort_event.set()
 
     def run(self):
+        emit = _StatusBatcher(self.signals.status_signal)
         try:
-            plate = motor_control.home(
-                status_callback=self.status_signal.emit,
-                should_abort=self._should_abort
-            )
+            with motor_control.realtime_thread():
+                plate = motor_control.home(
+                    status_callback=emit,
+                    should_abort=self._abort_event
+                )
             if plate is not None:
-                self.status_signal.emit(f"Homing finished. Plate #{plate}")
+                emit(f"Homing finished. Plate #{plate}")
             else:
-                self.status_signal.emit("Homing stopped.")
-            self.finished_with_result.emit(plate)
+                emit("Homing stopped.")
         except Exception as e:
-            self.status_signal.emit(f"Error: {e}")
-            self.finished_with_result.emit(None)
+            emit(f"Error: {e}")
+            plate = None
+        emit.flush()  # status lines land before the result
+        self.signals.finished_with_result.emit(plate)
+
+
+class _ApplySettingsSignals(QObject):
+    settings_applied = Signal()
+
+
+class ApplySettingsTask(QRunnable):
+    """Startup camera.apply_settings() on the global QThreadPool."""
+    def __init__(self):
+        super().__init__()
+        self.signals = _ApplySettingsSignals()
+
+    def run(self):
+        try:
+            camera.apply_settings()
+        finally:
+            self.signals.settings_applied.emit()
+
 
+class _LiveViewStartSignals(QObject):
+    started = Signal(object)  # the task's 'done' Event
 
-# MotorWorker class (kept for 'advance' only, with driver enable)
-class MotorWorker(QThread):
+
+class LiveViewStartTask(QRunnable):
+    """camera.configure_and_start() for Live View on the global QThreadPool.
+    'done' is set once it returns, so a stop can wait for it."""
+    def __init__(self):
+        super().__init__()
+        self.signals = _LiveViewStartSignals()
+        self.done = threading.Event()
+
+    def run(self):
+        try:
+            camera.configure_and_start(af_mode=2)  # Continuous AF for preview
+        finally:
+            self.done.set()
+            self.signals.started.emit(self.done)
+
+
+class _MotorSignals(QObject):
     status_signal = Signal(str)
 
+
+# MotorWorker runnable (kept for 'advance' only, with driver enable); runs on
+# the global QThreadPool, so no thread is created per click
+class MotorWorker(QRunnable):
     def __init__(self, action):
         super().__init__()
         self.action = action
+        self.signals = _MotorSignals()
 
     def run(self):
+        emit = _StatusBatcher(self.signals.status_signal)
         try:
-            if self.action == "advance":
-                self.status_signal.emit("Advancing to next plate...")
-                motor_control.driver_enable()  # ensure enabled before motion
-                motor_control.advance(status_callback=self.status_signal.emit)
-            elif self.action == "home":
-                # Not used anymore (replaced by HomingWorker), kept for compatibility
-                motor_control.driver_enable()
-                plate = motor_control.home(status_callback=self.status_signal.emit)
-                if plate is not None:
-                    self.status_signal.emit(f"Homing finished. Plate #{plate}")
-                else:
-                    self.status_signal.emit("Homing failed")
+            with motor_control.realtime_thread():
+                if self.action == "advance":
+                    emit("Advancing to next plate...")
+                    motor_control.driver_enable()  # ensure enabled before motion
+                    motor_control.advance(status_callback=emit)
+                elif self.action == "home":
+                    # Not used anymore (replaced by HomingWorker), kept for compatibility
+                    motor_control.driver_enable()
+                    plate = motor_control.home(status_callback=emit)
+                    if plate is not None:
+                        emit(f"Homing finished. Plate #{plate}")
+                    else:
+                        emit("Homing failed")
         except Exception as e:
-            self.status_signal.emit(f"Error: {e}")
+            emit(f"Error: {e}")
+        emit.flush()
@@ -1,7 +1,16 @@
 # motor_control.py
+import contextlib
+import ctypes
+import fcntl
+import os
+import sys
+import threading
 import time
+from collections import deque
+from functools import partial
 import gpiod
-from gpiod.line import Direction, Value, Bias
+from gpiod.line import Direction, Value, Bias, Edge
+from cpu_layout import MOTOR_CPUS  # a core no other pinned thread uses
 
 CHIP = "/dev/gpiochip0"
 EN_PIN = 21
@@ -9,45 +18,265 @@ STEP_PIN = 20
 DIR_PIN = 16
 SWITCH_PIN = 26   # Hall effect sensor
 OPTICAL_PIN = 19  # Optical sensor (ITR20001)
+LED_GREEN_PIN = 12
+LED_IR_PIN = 13
 
 steps_per_60_deg = 800
 calibration_offset_steps = 395
 current_plate = 0
 
-request = gpiod.request_lines(
-    CHIP,
-    consumer="seedling_imager",
-    config={
-        EN_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),  # EN low = enabled
-        DIR_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.ACTIVE),   # Clockwise
-        STEP_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
-        SWITCH_PIN: gpiod.LineSettings(direction=Direction.INPUT, bias=Bias.PULL_UP),
-        OPTICAL_PIN: gpiod.LineSettings(direction=Direction.INPUT, bias=Bias.PULL_UP)
-    }
-)
+request = None  # gpiod LineRequest, made by get_request() on first use
+driver_enabled = False  # EN state as last driven (the request starts it enabled)
+DRIVER_ENABLE_SETTLE_S = 0.001  # after EN goes low, before the first STEP edge
+
+def get_request():
+    """Request the motor, sensor and LED lines on first use rather than at import."""
+    global request, driver_enabled
+    if request is None:
+        request = gpiod.request_lines(
+            CHIP,
+            consumer="seedling_imager",
+            config={
+                EN_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),  # EN low = enabled
+                DIR_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.ACTIVE),   # Clockwise
+                STEP_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
+                # Sensors pull low when triggered; the kernel latches those falling
+                # edges, so a trigger passed during a step burst is still seen
+                SWITCH_PIN: gpiod.LineSettings(direction=Direction.INPUT, bias=Bias.PULL_UP, edge_detection=Edge.FALLING),
+                OPTICAL_PIN: gpiod.LineSettings(direction=Direction.INPUT, bias=Bias.PULL_UP, edge_detection=Edge.FALLING),
+                # Illumination shares this request (one fd; LEDs start off)
+                LED_GREEN_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
+                LED_IR_PIN: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.INACTIVE),
+            }
+        )
+        driver_enabled = True
+    return request
 
 def driver_enable():
-    """Drive EN low (enable output stages)."""
-    request.set_value(EN_PIN, Value.INACTIVE)
+    """Drive EN low (enable output stages); a no-op if already enabled."""
+    global driver_enabled
+    req = get_request()
+    if driver_enabled:
+        return
+    req.set_value(EN_PIN, Value.INACTIVE)
+    driver_enabled = True
+    time.sleep(DRIVER_ENABLE_SETTLE_S)
 
 def driver_disable():
-    """Drive EN high (disable output stages)."""
-    request.set_value(EN_PIN, Value.ACTIVE)
+    """Drive EN high (disable output stages). Always written, as a stop."""
+    global driver_enabled
+    get_request().set_value(EN_PIN, Value.ACTIVE)
+    driver_enabled = False
+
+# set_values() payloads for every (green_on, ir_on) combination, built once
+_LED_STATES = {
+    (g, i): {LED_GREEN_PIN: Value.ACTIVE if g else Value.INACTIVE,
+             LED_IR_PIN: Value.ACTIVE if i else Value.INACTIVE}
+    for g in (False, True) for i in (False, True)
+}
+
+def set_leds(green_on: bool, ir_on: bool):
+    """Drive both LED lines with one set_values() call (one GPIO ioctl)."""
+    get_request().set_values(_LED_STATES[bool(green_on), bool(ir_on)])
+
+def falling_edge_seen(pin=None):
+    """
+    Drain the queued sensor edge events (non-blocking); True if one of them
+    was on 'pin'. Call with no pin to discard stale edges before a seek.
+    """
+    req = get_request()
+    seen = False
+    while req.wait_edge_events(0):
+        for event in req.read_edge_events():
+            if event.line_offset == pin:
+                seen = True
+    return seen
+
+DEBUG = os.environ.get("SEEDLING_DEBUG") == "1"  # motion trace lines on stdout
+DEBUG_FLUSH_S = 0.5  # trace lines are written in one batch this often
+_debug_lines = deque(maxlen=1024)  # (monotonic time, line); oldest dropped if full
+_debug_writer = None
+
+def _debug_writer_loop():
+    while True:
+        time.sleep(DEBUG_FLUSH_S)
+        if _debug_lines:
+            out = []
+            while _debug_lines:
+                ts, msg = _debug_lines.popleft()
+                out.append(f"[{ts:.3f}] DEBUG: {msg}\n")
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+
+def _dbg(msg):
+    """Queue a motion trace line (only with SEEDLING_DEBUG=1); a daemon
+    thread writes the queue out, so the motion paths never block on stdout."""
+    global _debug_writer
+    if not DEBUG:
+        return
+    _debug_lines.append((time.monotonic(), msg))
+    if _debug_writer is None:
+        _debug_writer = threading.Thread(target=_debug_writer_loop, name="motor-debug", daemon=True)
+        _debug_writer.start()
+
+MOTOR_RT_PRIORITY = 50  # SCHED_FIFO priority while stepping; needs CAP_SYS_NICE
+MOTOR_NICE = -10        # fallback when real-time scheduling is not permitted
+_rt_warned = False      # report a missing privilege once, not on every move
+
+@contextlib.contextmanager
+def realtime_thread(cpus=MOTOR_CPUS, priority=MOTOR_RT_PRIORITY):
+    """
+    Best-effort: run the block on 'cpus' under SCHED_FIFO (or at MOTOR_NICE
+    if that is not permitted) so step pulses are not preempted. The thread's
+    previous affinity and scheduling are restored afterwards, since pool
+    threads are reused for GUI work.
+    """
+    global _rt_warned
+    tid = threading.get_native_id()
+    saved_cpus = saved_sched = saved_nice = None
+    if cpus and hasattr(os, "sched_setaffinity"):
+        try:
+            current = os.sched_getaffinity(tid)
+            allowed = set(cpus) & current
+            if allowed:
+                os.sched_setaffinity(tid, allowed)
+                saved_cpus = current
+        except OSError as e:
+            print(f"realtime_thread affinity error: {e}", flush=True)
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            policy, param = os.sched_getscheduler(tid), os.sched_getparam(tid)
+            os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(priority))
+            saved_sched = (policy, param)
+        except OSError as e:
+            try:
+                nice = os.getpriority(os.PRIO_PROCESS, tid)
+                os.setpriority(os.PRIO_PROCESS, tid, MOTOR_NICE)  # per-thread on Linux
+                saved_nice = nice
+            except OSError:
+                pass
+            if not _rt_warned:
+                _rt_warned = True
+                print(f"realtime_thread: SCHED_FIFO unavailable ({e})", flush=True)
+    try:
+        yield
+    finally:
+        try:
+            if saved_sched is not None:
+                os.sched_setscheduler(tid, *saved_sched)
+            if saved_nice is not None:
+                os.setpriority(os.PRIO_PROCESS, tid, saved_nice)
+            if saved_cpus is not None:
+                os.sched_setaffinity(tid, saved_cpus)
+        except OSError as e:
+            print(f"realtime_thread restore error: {e}", flush=True)
+
+SLEEP_SLACK_S = 0.0003  # tail of each step delay that is spun, not slept (wake-up jitter)
+
+def sleep_until(deadline, slack=SLEEP_SLACK_S):
+    """
+    Wait until perf_counter() reaches 'deadline': time.sleep() for all but the
+    last 'slack' seconds, then spin. Returns at once if it has already passed.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > slack:
+        time.sleep(remaining - slack)
+    while time.perf_counter() < deadline:
+        pass
+
+# STEP edge payloads, built once. set_value() would wrap every edge in a new
+# {line: value} dict and forward it to set_values(); both are one ioctl
+_STEP_HIGH = {STEP_PIN: Value.ACTIVE}
+_STEP_LOW = {STEP_PIN: Value.INACTIVE}
+
+class _LineValues(ctypes.Structure):
+    """struct gpio_v2_line_values: bit i is the i-th line of the request."""
+    _fields_ = [("bits", ctypes.c_uint64), ("mask", ctypes.c_uint64)]
+
+GPIO_V2_LINE_SET_VALUES_IOCTL = 0xC010B40F  # _IOWR(0xB4, 0x0F, struct gpio_v2_line_values)
+
+_step_edges = None  # (set STEP high, set STEP low), chosen on first move
+
+def _get_step_edges():
+    """
+    STEP edge writers: a direct GPIO_V2_LINE_SET_VALUES ioctl on the request
+    fd with prebuilt structs, probed once; set_values() if that fails.
+    """
+    global _step_edges
+    if _step_edges is None:
+        req = get_request()
+        edges = (partial(req.set_values, _STEP_HIGH), partial(req.set_values, _STEP_LOW))
+        try:
+            fd = req.fd
+            mask = 1 << list(req.offsets).index(STEP_PIN)
+            high, low = _LineValues(mask, mask), _LineValues(0, mask)
+            fcntl.ioctl(fd, GPIO_V2_LINE_SET_VALUES_IOCTL, low)  # STEP idles low
+            edges = (partial(fcntl.ioctl, fd, GPIO_V2_LINE_SET_VALUES_IOCTL, high),
+                     partial(fcntl.ioctl, fd, GPIO_V2_LINE_SET_VALUES_IOCTL, low))
+        except (AttributeError, ValueError, OSError) as e:
+            print(f"step_motor: raw ioctl unavailable, using set_values ({e})", flush=True)
+        _step_edges = edges
+    return _step_edges
+
+def _abort_check(should_abort):
+    """
+    Normalize 'should_abort' to a zero-argument check (or None): a
+    threading.Event is tested with is_set(), a callable is used as-is.
+    """
+    if isinstance(should_abort, threading.Event):
+        return should_abort.is_set
+    return should_abort if callable(should_abort) else None
 
 def step_motor(steps, delay=0.0025, should_abort=None):
     """
-    Step the motor a given number of steps. If should_abort() becomes True,
-    exit early and return False; otherwise return True on normal completion.
+    Step the motor a given number of steps. If should_abort (a
+    threading.Event or a callable) becomes set/True, exit early and return
+    False; otherwise return True on normal completion.
     """
+    # Bound once per move so the pulse loop runs on locals (LOAD_FAST)
+    step_high, step_low = _get_step_edges()
+    clock, wait = time.perf_counter, sleep_until
+    abort = _abort_check(should_abort)  # decided once, not per step
+    # Edges are timed against absolute deadlines, so a late wake-up shortens
+    # the next wait instead of stretching every period after it
+    next_t = clock()
     for _ in range(steps):
-        if callable(should_abort) and should_abort():
+        if abort is not None and abort():
             return False
-        request.set_value(STEP_PIN, Value.ACTIVE)
-        time.sleep(delay)
-        request.set_value(STEP_PIN, Value.INACTIVE)
-        time.sleep(delay)
+        now = clock()
+        if now - next_t > delay:
+            next_t = now  # fell behind (preempted); don't rush steps to catch up
+        step_high()
+        next_t += delay
+        wait(next_t)
+        step_low()
+        next_t += delay
+        wait(next_t)
     return True
 
+SEEK_DELAY_START_S = 0.003  # first fast-seek burst; ramps down to SEEK_DELAY_S
+SEEK_DELAY_S = 0.001        # fast-seek cruise (never faster: the carousel must not stall)
+SEEK_RAMP = 0.9             # delay factor per 10-step burst (~11 bursts to cruise)
+
+STATUS_REPEAT_S = 1.0  # a repeated progress line (e.g. "Searching for home...") at most this often
+
+def _throttled(status_callback, interval=STATUS_REPEAT_S):
+    """
+    Wrap a status callback so an unchanged line is passed on at most every
+    'interval' seconds; any different line always goes through.
+    """
+    if status_callback is None:
+        return None
+    last = {"msg": None, "t": float("-inf")}
+
+    def emit(msg):
+        now = time.monotonic()
+        if msg == last["msg"] and now - last["t"] < interval:
+            return
+        last["msg"], last["t"] = msg, now
+        status_callback(msg)
+    return emit
+
 def home(timeout=60, status_callback=None, should_abort=None):
     """
     Homing routine: seek hall sensor, then align with optical sensor.
@@ -55,60 +284,77 @@ def home(timeout=60, status_callback=None, should_abort=None):
 
     - timeout: seconds before giving up
     - status_callback: optional callable(str) for UI logging
-    - should_abort: optional callable() -> bool to request emergency stop
+    - should_abort: optional threading.Event (or callable() -> bool) to
+      request emergency stop
     """
     global current_plate
+    get_value = get_request().get_value
+    abort = _abort_check(should_abort)
     start_time = time.time()
+    # The seek loop reports after every 10-step burst; don't flood the GUI
+    status_callback = _throttled(status_callback)
     if status_callback:
         status_callback("Starting homing... Fast rotation")
-    print("DEBUG: Homing started", flush=True)
+    _dbg("Homing started")
 
-    # Rotate until hall sensor triggers
-    while request.get_value(SWITCH_PIN) == Value.ACTIVE:
-        if not step_motor(10, delay=0.001, should_abort=should_abort):
+    # Rotate until hall sensor triggers (level, or an edge latched mid-burst)
+    # Accelerate from rest into the cruise rate instead of starting at full speed
+    falling_edge_seen()
+    delay = SEEK_DELAY_START_S
+    while get_value(SWITCH_PIN) == Value.ACTIVE:
+        if not step_motor(10, delay=delay, should_abort=abort):
             if status_callback:
                 status_callback("Homing aborted by user.")
-            print("DEBUG: Homing aborted (fast rotation)", flush=True)
+            _dbg("Homing aborted (fast rotation)")
             return None
+        if falling_edge_seen(SWITCH_PIN):
+            break
+        delay = max(SEEK_DELAY_S, delay * SEEK_RAMP)
         if status_callback:
             status_callback("Searching for home...")
         if time.time() - start_time > timeout:
             if status_callback:
                 status_callback("Homing timeout! Switch not detected.")
-            print("DEBUG: Timeout occurred", flush=True)
+            _dbg("Timeout occurred")
             return None
-        if callable(should_abort) and should_abort():
+        if abort is not None and abort():
             if status_callback:
                 status_callback("Homing aborted by user.")
-            print("DEBUG: Homing aborted (timeout loop)", flush=True)
+            _dbg("Homing aborted (timeout loop)")
             return None
 
     if status_callback:
         status_callback("Hall sensor triggered! Checking optical sensor...")
-    print("DEBUG: Hall sensor triggered", flush=True)
+    _dbg("Hall sensor triggered")
 
-    # Count steps until optical sensor goes LOW
+    # Count steps until optical sensor goes LOW: read the level once, then
+    # check the latched falling edge after each single step
     steps_after_hall = 0
-    while request.get_value(OPTICAL_PIN) == Value.ACTIVE:
-        if not step_motor(1, delay=0.0025, should_abort=should_abort):
+    falling_edge_seen()  # drop edges latched during the fast seek
+    hit = get_value(OPTICAL_PIN) == Value.INACTIVE  # the only level read; edges after
+    while not hit:
+        if not step_motor(1, delay=0.0025, should_abort=abort):
             if status_callback:
                 status_callback("Homing aborted by user.")
-            print("DEBUG: Homing aborted (optical seek)", flush=True)
+            _dbg("Homing aborted (optical seek)")
             return None
         steps_after_hall += 1
+        if falling_edge_seen(OPTICAL_PIN):
+            hit = True
+            break
         if steps_after_hall > 2000:
             msg = "Optical sensor NOT detected within limit"
             print(msg, flush=True)
             if status_callback:
                 status_callback(msg)
             break
-        if callable(should_abort) and should_abort():
+        if abort is not None and abort():
             if status_callback:
                 status_callback("Homing aborted by user.")
-            print("DEBUG: Homing aborted (optical loop)", flush=True)
+            _dbg("Homing aborted (optical loop)")
             return None
 
-    if request.get_value(OPTICAL_PIN) == Value.INACTIVE:
+    if hit:
         msg = f"Optical sensor triggered after {steps_after_hall} steps"
         print(msg, flush=True)
         if status_callback:
@@ -119,54 +365,69 @@ def home(timeout=60, status_callback=None, should_abort=None):
     current_plate = 1
     return current_plate
 
+def _drift_correct(status_callback=None):
+    """
+    At Plate #1: step until the optical sensor triggers, then report the
+    extra steps (even if zero). Resets current_plate to 1.
+    """
+    global current_plate
+    get_value = get_request().get_value
+    if status_callback:
+        status_callback("Checking optical sensor for drift correction...")
+    _dbg("Checking optical sensor for drift correction...")
+    extra_steps = 0
+    falling_edge_seen()  # drop edges latched during the 60-degree move
+    hit = get_value(OPTICAL_PIN) == Value.INACTIVE  # the only level read; edges after
+    while not hit:
+        if not step_motor(1, delay=0.0025):
+            if status_callback:
+                status_callback("Drift correction aborted.")
+            _dbg("Drift correction aborted")
+            break
+        extra_steps += 1
+        if falling_edge_seen(OPTICAL_PIN):
+            hit = True
+            break
+        if extra_steps > 500:  # safety limit
+            msg = "Optical sensor not detected within limit!"
+            if status_callback:
+                status_callback(msg)
+            _dbg(msg)
+            break
+    # Reset plate count after correction
+    current_plate = 1
+    # Always report correction, even if 0 steps were needed
+    if extra_steps == 0 and hit:
+        msg = "Drift correction: already aligned at Plate #1 (0 extra steps)"
+    else:
+        msg = f"Drift correction applied with {extra_steps} extra steps. Plate reset to #1"
+    if status_callback:
+        status_callback(msg)
+    _dbg(msg)
+
 def advance(status_callback=None):
     global current_plate
     # NOTE: callers should ensure driver is enabled before calling advance()
     if not step_motor(steps_per_60_deg):
         if status_callback:
             status_callback("Advance aborted.")
-        print("DEBUG: Advance aborted", flush=True)
+        _dbg("Advance aborted")
         return current_plate
     current_plate = (current_plate % 6) + 1
     msg = f"Moved to Plate #{current_plate}"
     if status_callback:
         status_callback(msg)
-    print(f"DEBUG: {msg}", flush=True)
+    _dbg(msg)
 
     # Drift correction when returning to Plate #1
     if current_plate == 1:
-        if status_callback:
-            status_callback("Checking optical sensor for drift correction...")
-        print("DEBUG: Checking optical sensor for drift correction...", flush=True)
-        extra_steps = 0
-        while request.get_value(OPTICAL_PIN) == Value.ACTIVE:
-            if not step_motor(1, delay=0.0025):
-                if status_callback:
-                    status_callback("Drift correction aborted.")
-                print("DEBUG: Drift correction aborted", flush=True)
-                break
-            extra_steps += 1
-            if extra_steps > 500:  # safety limit
-                msg = "Optical sensor not detected within limit!"
-                if status_callback:
-                    status_callback(msg)
-                print(f"DEBUG: {msg}", flush=True)
-                break
-        # Reset plate count after correction
-        current_plate = 1
-        # Always report correction, even if 0 steps were needed
-        if extra_steps == 0 and request.get_value(OPTICAL_PIN) == Value.INACTIVE:
-            msg = "Drift correction: already aligned at Plate #1 (0 extra steps)"
-        else:
-            msg = f"Drift correction applied with {extra_steps} extra steps. Plate reset to #1"
-        if status_callback:
-            status_callback(msg)
-        print(f"DEBUG: {msg}", flush=True)
+        _drift_correct(status_callback)
     return current_plate
 
-def goto_plate(target_plate, status_callback=None):
+def goto_plate(target_plate, status_callback=None, should_abort=None):
     """
-    Move to the specified target plate (1..6) using repeated advance().
+    Move to the specified target plate (1..6) in one continuous move
+    (clockwise, as advance() does). Drift correction runs if the target is #1.
     """
     global current_plate
     target_plate = int(target_plate)
@@ -174,12 +435,23 @@ def goto_plate(target_plate, status_callback=None):
         if status_callback:
             status_callback(f"goto_plate: invalid target {target_plate}")
         return current_plate
+    delta = (target_plate - current_plate) % 6
+    if delta == 0:
+        return current_plate
     if status_callback:
         status_callback(f"Moving to Plate #{target_plate} from #{current_plate}")
-    max_steps = 6
-    while current_plate != target_plate and max_steps > 0:
-        advance(status_callback=status_callback)
-        max_steps -= 1
+    if not step_motor(delta * steps_per_60_deg, should_abort=should_abort):
+        if status_callback:
+            status_callback("Move aborted.")
+        _dbg("goto_plate aborted")
+        return current_plate
+    current_plate = target_plate
+    msg = f"Moved to Plate #{current_plate}"
+    if status_callback:
+        status_callback(msg)
+    _dbg(msg)
+    if current_plate == 1:
+        _drift_correct(status_callback)
     return current_plate
 
     def get_current_plate():
@@ -1,31 +0,0 @@
-# styles.py
-dark_style = """
-QWidget {
-    background-color: #121212;
-    color: #FFFFFF;
-    font-size: 18px;
-}
-
-QPushButton {
-    background-color: #1E88E5;
-    color: #FFFFFF;
-    border-radius: 8px;
-    padding: 12px;
-    font-size: 20px;
-}
-
-QPushButton:hover {
-    background-color: #1565C0;
-}
-
-QLabel {
-    font-size: 18px;
-}
-
-QSpinBox {
-    background-color: #1E1E1E;
-    color: #FFFFFF;
-    border: 1px solid #333333;
-    font-size: 18px;
-}
-"""
@@ -28,4 +28,128 @@ QSpinBox {
     border: 1px solid #333333;
     font-size: 18px;
 }
+
+/* Experiment Setup dialog (object names set in experiment_setup.py) */
+QLineEdit#numBox {
+    background-color: white;
+    color: black;
+    font-size: 22px;
+}
+
+QPushButton#arrow {
+    background-color: #ccc;
+    font-size: 24px;
+    font-weight: bold;
+}
+
+QPushButton#illumToggle {
+    color: white;
+    font-size: 18px;
+    font-weight: bold;
+    border-radius: 8px;
+}
+
+QPushButton#illumToggle[illum="Green"] {
+    background-color: #26A69A;
+}
+
+QPushButton#illumToggle[illum="Infrared"] {
+    background-color: #B71C1C;
+}
+
+QCheckBox#plateBox {
+    color: white;
+    font-size: 16px;
+}
+
+QCheckBox#plateBox::indicator {
+    width: 22px;
+    height: 22px;
+}
+
+QCheckBox#plateBox::indicator:unchecked {
+    border: 2px solid #BBBBBB;
+    background: #222222;
+}
+
+QCheckBox#plateBox::indicator:checked {
+    border: 2px solid #1E88E5;
+    background: #1E88E5;
+}
+
+QLabel#storageLabel {
+    font-size: 16px;
+    color: #CCCCCC;
+}
+
+QLabel#storageLabel[state="ok"] {
+    color: #43A047;
+}
+
+QLabel#storageLabel[state="over"] {
+    color: #E53935;
+}
+
+QPushButton#startButton, QPushButton#exitButton {
+    color: white;
+    font-weight: bold;
+    padding: 10px;
+    font-size: 18px;
+}
+
+QPushButton#startButton {
+    background-color: #43A047;
+}
+
+QPushButton#exitButton {
+    background-color: #E53935;
+}
+
+/* Main window (object names set in gui.py). The Illum button reuses
+   #illumToggle from the Experiment Setup rules above */
+QPushButton#liveViewBtn {
+    background-color: #FFD600;
+    color: black;
+}
+
+QPushButton#liveViewBtn[state="on"] {
+    background-color: #43A047;
+    color: white;
+}
+
+QPushButton#homeBtn[state="stop"] {
+    background-color: #E53935;
+    color: white;
+    font-weight: bold;
+}
+
+QPushButton#experimentBtn {
+    background-color: #8E24AA;
+    color: white;
+}
+
+QPushButton#endExperimentBtn {
+    background-color: #E53935;
+    color: white;
+}
+
+QPushButton#cameraConfigBtn {
+    background-color: #546E7A;
+    color: white;
+}
+
+QPushButton#fileManagerBtn {
+    background-color: #455A64;
+    color: white;
+}
 """
+
+
+def set_style_property(widget, name, value):
+    """Switch a dynamic property used by a dark_style selector; only the one
+    widget is re-polished (no stylesheet is parsed)."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)